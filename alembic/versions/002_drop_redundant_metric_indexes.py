@@ -0,0 +1,30 @@
+"""drop_redundant_metric_indexes
+
+Revision ID: 002
+Revises: 447c78426975
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "447c78426975"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both are covered by the leading columns of ix_metrics_device_type_created.
+    # IF EXISTS because ix_metrics_device_created was only ever created by
+    # metadata.create_all(), never by a migration.
+    op.execute("DROP INDEX IF EXISTS ix_metrics_device_created")
+    op.execute("DROP INDEX IF EXISTS ix_metrics_device_id")
+
+
+def downgrade() -> None:
+    op.create_index("ix_metrics_device_id", "metrics", ["device_id"])
+    op.create_index("ix_metrics_device_created", "metrics", ["device_id", "created_at"])
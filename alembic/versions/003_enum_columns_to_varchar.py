@@ -0,0 +1,88 @@
+"""enum_columns_to_varchar
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type name, member values)
+# Native enums stored member names (e.g. 'ROUTER'); the VARCHAR columns store
+# the lowercase member values (e.g. 'router'), hence lower()/upper() below.
+ENUM_COLUMNS = [
+    (
+        "devices",
+        "device_type",
+        "devicetype",
+        ["router", "switch", "firewall", "access_point", "other"],
+    ),
+    (
+        "metrics",
+        "metric_type",
+        "metrictype",
+        [
+            "cpu_utilization",
+            "memory_utilization",
+            "uptime",
+            "interface_status",
+            "interface_in_octets",
+            "interface_out_octets",
+            "interface_in_errors",
+            "interface_out_errors",
+            "interface_in_rate",
+            "interface_out_rate",
+            "bgp_neighbor_state",
+            "ospf_neighbor_state",
+            "connection_count",
+            "failover_status",
+            "ping_latency",
+            "ping_loss",
+            "custom",
+        ],
+    ),
+    (
+        "remediation_logs",
+        "status",
+        "remediationstatus",
+        ["pending", "in_progress", "success", "failed", "skipped"],
+    ),
+]
+
+
+def _in_list(values: list[str]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(32) "
+            f"USING lower({column}::text)"
+        )
+        op.execute(f"DROP TYPE IF EXISTS {type_name}")
+        # op.f(): the name is final, don't run it through the ck_ naming convention again
+        op.create_check_constraint(
+            op.f(f"ck_{table}_{column}"), table, f"{column} IN ({_in_list(values)})"
+        )
+
+
+def downgrade() -> None:
+    for table, column, type_name, values in ENUM_COLUMNS:
+        op.drop_constraint(op.f(f"ck_{table}_{column}"), table, type_="check")
+        names = [v.upper() for v in values]
+        op.execute(f"CREATE TYPE {type_name} AS ENUM ({_in_list(names)})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING upper({column})::{type_name}"
+        )
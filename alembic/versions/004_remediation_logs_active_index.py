@@ -0,0 +1,31 @@
+"""remediation_logs_active_index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_remediation_logs_active",
+        "remediation_logs",
+        ["device_id", "status"],
+        postgresql_where=sa.text("status IN ('pending', 'in_progress')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_remediation_logs_active", table_name="remediation_logs")
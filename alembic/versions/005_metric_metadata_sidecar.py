@@ -0,0 +1,61 @@
+"""metric_metadata_sidecar
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metric_metadata",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("metric_id", sa.Integer(), nullable=False),
+        sa.Column("data", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["metric_id"],
+            ["metrics.id"],
+            name="fk_metric_metadata_metric_id_metrics",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name="pk_metric_metadata"),
+        sa.UniqueConstraint("metric_id", name="uq_metric_metadata_metric_id"),
+    )
+
+    # Move existing metadata out of the metrics rows
+    op.execute(
+        """
+        INSERT INTO metric_metadata (metric_id, data, created_at, updated_at)
+        SELECT id, metadata::jsonb, created_at, updated_at
+        FROM metrics
+        WHERE metadata IS NOT NULL
+        """
+    )
+    op.drop_column("metrics", "metadata")
+
+
+def downgrade() -> None:
+    op.add_column("metrics", sa.Column("metadata", sa.JSON(), nullable=True))
+    op.execute(
+        """
+        UPDATE metrics SET metadata = mm.data::json
+        FROM metric_metadata mm
+        WHERE mm.metric_id = metrics.id
+        """
+    )
+    op.drop_table("metric_metadata")
@@ -0,0 +1,58 @@
+"""metrics_hypertable
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:00.000000
+
+Converts metrics into a TimescaleDB hypertable with 1-day chunks when the
+timescaledb extension is available on the server. On plain PostgreSQL this
+migration is a no-op and cleanup_old_metrics keeps using DELETE.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _timescaledb_available() -> bool:
+    bind = op.get_bind()
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb'")
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    if not _timescaledb_available():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+
+    # Hypertables need every unique constraint to include the time column, so
+    # the single-column PK (and the FK from metric_metadata that depends on it)
+    # cannot stay. Sidecar rows are cleaned up by cleanup_old_metrics instead.
+    op.drop_constraint(
+        "fk_metric_metadata_metric_id_metrics", "metric_metadata", type_="foreignkey"
+    )
+    op.drop_constraint("pk_metrics", "metrics", type_="primary")
+    op.create_primary_key("pk_metrics", "metrics", ["id", "created_at"])
+
+    op.execute(
+        "SELECT create_hypertable('metrics', 'created_at', "
+        "chunk_time_interval => INTERVAL '1 day', migrate_data => true)"
+    )
+
+
+def downgrade() -> None:
+    # Converting a hypertable back to a plain table requires copying the data
+    # out; this is left as a manual operation.
+    pass
@@ -0,0 +1,34 @@
+"""metrics_covering_index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_metrics_device_type_created", table_name="metrics")
+    op.create_index(
+        "ix_metrics_device_type_created",
+        "metrics",
+        ["device_id", "metric_type", "created_at"],
+        postgresql_include=["value"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_metrics_device_type_created", table_name="metrics")
+    op.create_index(
+        "ix_metrics_device_type_created", "metrics", ["device_id", "metric_type", "created_at"]
+    )
@@ -0,0 +1,35 @@
+"""server_side_timestamps
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ["users", "devices", "metrics", "metric_metadata", "alerts", "remediation_logs"]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"SET DEFAULT timezone('utc', now())"
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
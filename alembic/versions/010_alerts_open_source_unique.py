@@ -0,0 +1,55 @@
+"""alerts_open_source_unique
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# alerts.status is still a native enum, so the predicate uses member names
+OPEN_POLLER_ALERTS = (
+    "status IN ('ACTIVE', 'ACKNOWLEDGED') AND alert_type IN "
+    "('interface_down', 'cpu_utilization', 'memory_utilization', 'ping_loss')"
+)
+
+
+def upgrade() -> None:
+    # Resolve all but the newest open alert per source so the index can be built
+    op.execute(
+        f"""
+        UPDATE alerts SET status = 'RESOLVED',
+            resolved_at = timezone('utc', now()),
+            resolution_notes = 'Duplicate open alert (auto-resolved by migration)'
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY device_id, alert_type, coalesce(context ->> 'if_index', '')
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM alerts
+                WHERE {OPEN_POLLER_ALERTS}
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX uq_alerts_open_source ON alerts "
+        "(device_id, alert_type, (coalesce(context ->> 'if_index', ''))) "
+        f"WHERE {OPEN_POLLER_ALERTS}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_alerts_open_source", table_name="alerts")
@@ -0,0 +1,37 @@
+"""metrics_previous_sample_index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 001 never created this index (only create_all from the models did), so
+    # a database built from the migrations doesn't have it
+    op.execute("DROP INDEX IF EXISTS ix_metrics_device_context")
+    op.create_index(
+        "ix_metrics_device_context",
+        "metrics",
+        ["device_id", "metric_type", "context", sa.text("created_at DESC")],
+        postgresql_include=["value"],
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_metrics_device_context")
+    op.create_index(
+        "ix_metrics_device_context", "metrics", ["device_id", "metric_type", "context"]
+    )
@@ -0,0 +1,32 @@
+"""devices_last_seen_timestamp
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing values are datetime.isoformat() strings (naive UTC)
+    op.execute(
+        "ALTER TABLE devices ALTER COLUMN last_seen TYPE timestamp without time zone "
+        "USING last_seen::timestamp"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE devices ALTER COLUMN last_seen TYPE varchar(50) "
+        "USING replace(last_seen::text, ' ', 'T')"
+    )
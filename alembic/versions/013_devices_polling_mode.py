@@ -0,0 +1,34 @@
+"""devices_polling_mode
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "devices",
+        sa.Column("polling_mode", sa.String(length=32), server_default="pull", nullable=False),
+    )
+    # op.f(): the name is final, don't run it through the ck_ naming convention again
+    op.create_check_constraint(
+        op.f("ck_devices_polling_mode"), "devices", "polling_mode IN ('pull', 'event')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(op.f("ck_devices_polling_mode"), "devices", type_="check")
+    op.drop_column("devices", "polling_mode")
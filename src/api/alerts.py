@@ -3,12 +3,13 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.base import get_db
 from src.models.alert import Alert, AlertSeverity, AlertStatus
+from src.schemas import ALERT_LIST_ADAPTER, dump_list_json
 from src.schemas.alert import AlertCreate, AlertUpdate, AlertResponse
 from src.api.auth import get_current_user
 from src.models.user import User
@@ -38,7 +39,10 @@ async def list_alerts(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(ALERT_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/active", response_model=list[AlertResponse])
@@ -53,7 +57,10 @@ async def list_active_alerts(
         .order_by(Alert.severity.desc(), Alert.created_at.desc())
     )
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(ALERT_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/{alert_id}", response_model=AlertResponse)
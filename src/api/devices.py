@@ -3,20 +3,22 @@
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.models.base import get_db
 from src.models.device import Device, DeviceType
+from src.schemas import DEVICE_LIST_ADAPTER, dump_list_json
 from src.schemas.device import DeviceCreate, DeviceUpdate, DeviceResponse
 from src.api.auth import get_current_user
 from src.models.user import User
 from src.core.health_checks import check_device_connectivity, HealthCheckService
 from src.drivers.base import DevicePlatform
 from src.integrations.netbox import NetBoxClient, NetBoxSyncService
-from src.tasks.polling import poll_all_devices
+from src.tasks.polling import handle_device_event, poll_all_devices
 
 router = APIRouter()
 
@@ -66,7 +68,10 @@ async def list_devices(
 
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(DEVICE_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/{device_id}", response_model=DeviceResponse)
@@ -134,7 +139,16 @@ async def delete_device(
     current_user: User = Depends(get_current_user),
 ):
     """Delete a device."""
-    result = await db.execute(select(Device).where(Device.id == device_id))
+    # Cascade delete needs the child collections, which are lazy="raise"
+    result = await db.execute(
+        select(Device)
+        .where(Device.id == device_id)
+        .options(
+            selectinload(Device.metrics),
+            selectinload(Device.alerts),
+            selectinload(Device.remediation_logs),
+        )
+    )
     device = result.scalar_one_or_none()
 
     if not device:
@@ -187,7 +201,7 @@ async def check_device_connectivity_endpoint(
 
     # Update device reachability status
     device.is_reachable = check_result.overall_reachable
-    device.last_seen = datetime.utcnow().isoformat() if check_result.overall_reachable else device.last_seen
+    device.last_seen = datetime.utcnow() if check_result.overall_reachable else device.last_seen
 
     # Update OS version if SSH check was successful and returned version info
     if check_result.ssh and check_result.ssh.get("success") and check_result.ssh.get("os_version"):
@@ -250,6 +264,36 @@ async def check_all_devices_connectivity(
     )
 
 
+class DeviceEventRequest(BaseModel):
+    """A device event forwarded by a trap/syslog receiver."""
+
+    ip_address: str
+    event: Optional[str] = None
+
+
+class DeviceEventResponse(BaseModel):
+    """Response for device event endpoint."""
+    task_id: str
+    status: str
+
+
+@router.post("/events", response_model=DeviceEventResponse, status_code=202)
+async def report_device_event(
+    event: DeviceEventRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Report an event (SNMP trap, syslog message) from a device.
+
+    This is how event-mode devices get polled between safety-net cycles:
+    point the trap/syslog receiver (e.g. an snmptrapd traphandle) at this
+    endpoint with the sender's address. The device lookup and poll run in
+    the background; events from unknown addresses are ignored there.
+    """
+    task = handle_device_event.delay(event.ip_address, event.event)
+    return DeviceEventResponse(task_id=task.id, status="queued")
+
+
 # NetBox sync endpoints
 
 @router.get("/netbox/status")
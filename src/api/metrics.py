@@ -3,13 +3,14 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased
+from sqlalchemy.orm import aliased, selectinload
 
 from src.models.base import get_db
 from src.models.metric import Metric, MetricType
+from src.schemas import METRIC_LIST_ADAPTER, dump_list_json
 from src.schemas.metric import MetricCreate, MetricResponse, MetricSummary
 from src.api.auth import get_current_user
 from src.models.user import User
@@ -36,9 +37,17 @@ async def list_metrics(
     if metric_type:
         query = query.where(Metric.metric_type == metric_type)
 
-    query = query.order_by(Metric.created_at.desc()).offset(skip).limit(limit)
+    query = (
+        query.options(selectinload(Metric.metadata_record))
+        .order_by(Metric.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(METRIC_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 # Map frontend metric names to enum values
@@ -80,11 +89,15 @@ async def get_metrics_history(
             Metric.metric_type == enum_type,
             Metric.created_at >= cutoff
         )
+        .options(selectinload(Metric.metadata_record))
         .order_by(Metric.created_at.asc())  # Ascending for charts
         .limit(1000)  # Limit data points for performance
     )
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(METRIC_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/history/batch", response_model=dict)
@@ -120,6 +133,7 @@ async def get_metrics_history_batch(
             Metric.metric_type.in_(enum_types),
             Metric.created_at >= cutoff
         )
+        .options(selectinload(Metric.metadata_record))
         .order_by(Metric.metric_type, Metric.created_at.asc())
     )
     result = await db.execute(query)
@@ -163,9 +177,12 @@ async def get_device_metrics(
     if metric_type:
         query = query.where(Metric.metric_type == metric_type)
 
-    query = query.order_by(Metric.created_at.desc())
+    query = query.options(selectinload(Metric.metadata_record)).order_by(Metric.created_at.desc())
     result = await db.execute(query)
-    return result.scalars().all()
+    return Response(
+        dump_list_json(METRIC_LIST_ADAPTER, result.scalars().all()),
+        media_type="application/json",
+    )
 
 
 @router.get("/device/{device_id}/latest", response_model=dict)
@@ -231,7 +248,7 @@ async def get_device_metrics_summary(
             func.min(Metric.value).label("min_value"),
             func.max(Metric.value).label("max_value"),
             func.avg(Metric.value).label("avg_value"),
-            func.count(Metric.id).label("count"),
+            func.count().label("count"),
         )
         .where(Metric.device_id == device_id, Metric.created_at >= cutoff)
         .group_by(Metric.metric_type)
@@ -294,7 +311,7 @@ async def create_metric(
     metric = Metric(**metric_data.model_dump())
     db.add(metric)
     await db.flush()
-    await db.refresh(metric)
+    await db.refresh(metric, ["metadata_record"])
     return metric
 
 
@@ -305,8 +322,6 @@ async def get_device_routing_neighbors(
     current_user: User = Depends(get_current_user),
 ):
     """Get BGP and OSPF neighbor states for a device."""
-    from sqlalchemy.orm import selectinload
-
     # Get latest BGP neighbors
     bgp_subquery = (
         select(
@@ -332,6 +347,7 @@ async def get_device_routing_neighbors(
             Metric.device_id == device_id,
             Metric.metric_type == MetricType.BGP_NEIGHBOR_STATE,
         )
+        .options(selectinload(Metric.metadata_record))
     )
 
     bgp_result = await db.execute(bgp_query)
@@ -376,6 +392,7 @@ async def get_device_routing_neighbors(
             Metric.device_id == device_id,
             Metric.metric_type == MetricType.OSPF_NEIGHBOR_STATE,
         )
+        .options(selectinload(Metric.metadata_record))
     )
 
     ospf_result = await db.execute(ospf_query)
@@ -2,8 +2,11 @@
 
 import asyncio
 import logging
+import re
+import shutil
 import subprocess
 from dataclasses import dataclass
+from functools import cache
 from datetime import datetime
 from typing import Optional
 
@@ -69,9 +72,15 @@ async def ping_host(host: str, count: int = 3, timeout: int = 5) -> PingResult:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(), timeout=timeout + 5
-        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout + 5
+            )
+        except (asyncio.CancelledError, TimeoutError):
+            # Don't leave the ping process running once the caller stops waiting
+            if process.returncode is None:
+                process.kill()
+            raise
 
         output = stdout.decode()
 
@@ -115,13 +124,120 @@ async def ping_host(host: str, count: int = 3, timeout: int = 5) -> PingResult:
                 error=f"Ping failed with return code {process.returncode}",
             )
 
-    except asyncio.TimeoutError:
+    except TimeoutError:
         return PingResult(success=False, error="Ping timed out")
     except Exception as e:
         logger.error(f"Ping error for {host}: {e}")
         return PingResult(success=False, error=str(e))
 
 
+# fping -q summary line, e.g.
+# "10.0.0.1 : xmt/rcv/%loss = 3/3/0%, min/avg/max = 0.03/0.04/0.05"
+# (the min/avg/max part is missing when nothing came back)
+FPING_SUMMARY_RE = re.compile(
+    r"^(?P<host>\S+)\s*:\s*xmt/rcv/%loss = \d+/\d+/(?P<loss>[\d.]+)%"
+    r"(?:, min/avg/max = [\d.]+/(?P<avg>[\d.]+)/[\d.]+)?"
+)
+
+# fping pacing: minimum gap between any two packets it sends (-i), and
+# between packets to the same host (-p)
+FPING_INTERVAL_MS = 10
+FPING_PERIOD_MS = 1000
+
+
+@cache
+def fping_available() -> bool:
+    """Whether fping is installed; a missing binary is logged once per process."""
+    if shutil.which("fping") is None:
+        logger.warning("fping not installed, devices will be pinged one by one")
+        return False
+    return True
+
+
+def fping_run_timeout(host_count: int, count: int, timeout: int) -> float:
+    """Upper bound in seconds on how long one fping run over host_count hosts takes.
+
+    fping sends no faster than one packet per FPING_INTERVAL_MS across all
+    hosts, so the send phase grows with host_count * count; the last packets
+    then get the per-packet timeout to come back.
+    """
+    send_ms = max(host_count * count * FPING_INTERVAL_MS, (count - 1) * FPING_PERIOD_MS)
+    return send_ms / 1000 + timeout + 5
+
+
+async def ping_hosts(hosts: list[str], count: int = 3, timeout: int = 3) -> dict[str, PingResult]:
+    """
+    Ping many hosts with a single fping process.
+
+    Args:
+        hosts: IP addresses or hostnames to ping
+        count: Number of ping packets to send to each host
+        timeout: Per-packet timeout in seconds
+
+    Returns:
+        PingResult per host that fping reported on. Empty if fping isn't
+        installed or fails, in which case callers fall back to ping_host().
+    """
+    if not hosts:
+        return {}
+    if not fping_available():
+        return {}
+
+    # Targets go in on stdin so large fleets don't run into argv limits
+    cmd = [
+        "fping",
+        "-q",
+        "-c", str(count),
+        "-t", str(timeout * 1000),
+        "-i", str(FPING_INTERVAL_MS),
+        "-p", str(FPING_PERIOD_MS),
+    ]
+    run_timeout = fping_run_timeout(len(hosts), count, timeout)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate("\n".join(hosts).encode()), timeout=run_timeout
+            )
+        except (asyncio.CancelledError, TimeoutError):
+            if process.returncode is None:
+                process.kill()
+            raise
+    except TimeoutError:
+        logger.warning(
+            f"fping over {len(hosts)} hosts didn't finish within {run_timeout:.0f}s, "
+            "falling back to per-device pings"
+        )
+        return {}
+    except Exception as e:
+        logger.error(f"fping error: {e}")
+        return {}
+
+    results = {}
+    for line in stderr.decode().splitlines():
+        match = FPING_SUMMARY_RE.match(line)
+        if not match:
+            continue
+        packet_loss = float(match.group("loss"))
+        avg = match.group("avg")
+        if packet_loss < 100.0:
+            results[match.group("host")] = PingResult(
+                success=True,
+                latency_ms=float(avg) if avg else None,
+                packet_loss=packet_loss,
+            )
+        else:
+            results[match.group("host")] = PingResult(
+                success=False, error="No reply from host"
+            )
+    return results
+
+
 def check_snmp(
     host: str,
     community: str = "public",
@@ -302,13 +418,16 @@ async def check_device_connectivity(
     if check_ping:
         result.ping = await ping_host(ip_address)
 
-    # Run SNMP check (sync, but quick)
+    # SNMP and SSH checks are blocking; run them in threads so the event
+    # loop keeps serving other requests and concurrent checks meanwhile
     if check_snmp:
-        result.snmp = globals()["check_snmp"](ip_address, snmp_community)
+        result.snmp = await asyncio.to_thread(
+            globals()["check_snmp"], ip_address, snmp_community
+        )
 
-    # Run SSH check (sync, can be slow)
     if check_ssh and username and password:
-        result.ssh = globals()["check_ssh"](
+        result.ssh = await asyncio.to_thread(
+            globals()["check_ssh"],
             ip_address,
             username,
             password,
@@ -2,8 +2,8 @@
 
 from src.models.base import Base
 from src.models.user import User
-from src.models.device import Device, DeviceType
-from src.models.metric import Metric, MetricType
+from src.models.device import Device, DeviceType, PollingMode
+from src.models.metric import Metric, MetricMetadata, MetricType
 from src.models.alert import Alert, AlertSeverity, AlertStatus
 from src.models.remediation_log import RemediationLog, RemediationStatus
 
@@ -12,7 +12,9 @@ __all__ = [
     "User",
     "Device",
     "DeviceType",
+    "PollingMode",
     "Metric",
+    "MetricMetadata",
     "MetricType",
     "Alert",
     "AlertSeverity",
@@ -4,7 +4,7 @@ import enum
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import String, ForeignKey, Enum, Text, JSON, Index
+from sqlalchemy import String, ForeignKey, Enum, Text, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -62,6 +62,19 @@ class Alert(Base):
         Index("ix_alerts_device_status", "device_id", "status"),
         Index("ix_alerts_device_severity", "device_id", "severity"),
         Index("ix_alerts_status_severity", "status", "severity"),
+        # At most one open alert per source for the poller-managed alert
+        # types; lets the poller insert with ON CONFLICT DO NOTHING
+        Index(
+            "uq_alerts_open_source",
+            "device_id",
+            "alert_type",
+            text("coalesce(context ->> 'if_index', '')"),
+            unique=True,
+            postgresql_where=text(
+                "status IN ('ACTIVE', 'ACKNOWLEDGED') AND alert_type IN "
+                "('interface_down', 'cpu_utilization', 'memory_utilization', 'ping_loss')"
+            ),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -3,11 +3,12 @@
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, func
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from src.config import get_settings
+from src.models.types import json_deserializer, json_serializer
 
 # Naming convention for constraints (helps with migrations)
 convention = {
@@ -19,15 +20,25 @@ convention = {
 }
 
 
+def utc_now():
+    """SQL expression for the current time as naive UTC."""
+    return func.timezone("utc", func.now())
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
     metadata = MetaData(naming_convention=convention)
 
+    # Timestamps are filled in by PostgreSQL (naive UTC, matching the
+    # datetime.utcnow() values the rest of the code compares against), so
+    # inserts don't bind them; eager_defaults fetches them back via RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(server_default=utc_now())
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow, onupdate=datetime.utcnow
+        server_default=utc_now(), onupdate=utc_now()
     )
 
 
@@ -37,6 +48,8 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 AsyncSessionLocal = async_sessionmaker(
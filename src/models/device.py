@@ -1,12 +1,14 @@
 """Device model for network devices."""
 
 import enum
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Boolean, Enum, Text, JSON
+from sqlalchemy import String, Integer, Boolean, Text, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
+from src.models.types import StringEnum, enum_check
 
 
 class DeviceType(enum.Enum):
@@ -19,6 +21,17 @@ class DeviceType(enum.Enum):
     OTHER = "other"
 
 
+# Value -> member lookup; avoids DeviceType(value) on hot validation paths
+DEVICE_TYPE_BY_VALUE: dict[str, DeviceType] = {m.value: m for m in DeviceType}
+
+
+class PollingMode(enum.Enum):
+    """How a device's metrics collection is triggered."""
+
+    PULL = "pull"  # Polled every polling cycle
+    EVENT = "event"  # Polled on device events (traps/syslog), plus a slow safety-net cycle
+
+
 class Device(Base):
     """Network device model."""
 
@@ -28,7 +41,7 @@ class Device(Base):
     name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
     hostname: Mapped[str] = mapped_column(String(255))
     ip_address: Mapped[str] = mapped_column(String(45), index=True)  # IPv6 max length
-    device_type: Mapped[DeviceType] = mapped_column(Enum(DeviceType))
+    device_type: Mapped[DeviceType] = mapped_column(StringEnum(DeviceType))
     vendor: Mapped[str] = mapped_column(String(50), default="cisco")
     model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     os_version: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -36,7 +49,10 @@ class Device(Base):
     # Status
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_reachable: Mapped[bool] = mapped_column(Boolean, default=False)
-    last_seen: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    last_seen: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    polling_mode: Mapped[PollingMode] = mapped_column(
+        StringEnum(PollingMode), default=PollingMode.PULL, server_default=PollingMode.PULL.value
+    )
 
     # Connection settings
     snmp_community: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -52,15 +68,20 @@ class Device(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     tags: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
-    # Relationships
+    # Relationships (lazy="raise": load explicitly with selectinload() where needed)
     metrics: Mapped[list["Metric"]] = relationship(
-        "Metric", back_populates="device", cascade="all, delete-orphan"
+        "Metric", back_populates="device", cascade="all, delete-orphan", lazy="raise"
     )
     alerts: Mapped[list["Alert"]] = relationship(
-        "Alert", back_populates="device", cascade="all, delete-orphan"
+        "Alert", back_populates="device", cascade="all, delete-orphan", lazy="raise"
     )
     remediation_logs: Mapped[list["RemediationLog"]] = relationship(
-        "RemediationLog", back_populates="device", cascade="all, delete-orphan"
+        "RemediationLog", back_populates="device", cascade="all, delete-orphan", lazy="raise"
+    )
+
+    __table_args__ = (
+        enum_check("device_type", DeviceType),
+        enum_check("polling_mode", PollingMode),
     )
 
     def __repr__(self) -> str:
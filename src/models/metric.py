@@ -3,10 +3,12 @@
 import enum
 from typing import Optional
 
-from sqlalchemy import String, Float, ForeignKey, Enum, JSON, Index
+from sqlalchemy import String, Float, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
+from src.models.types import StringEnum, enum_check
 
 
 class MetricType(enum.Enum):
@@ -42,38 +44,111 @@ class MetricType(enum.Enum):
     CUSTOM = "custom"
 
 
+# Value -> member lookup; avoids MetricType(value) on hot validation paths
+METRIC_TYPE_BY_VALUE: dict[str, MetricType] = {m.value: m for m in MetricType}
+
+
 class Metric(Base):
-    """Time-series metric data for devices."""
+    """Time-series metric data for devices.
+
+    Indexes are kept to the minimum the read paths need, since every extra
+    B-tree is paid for on each insert into this (highest-volume) table.
+    ``ix_metrics_device_type_created`` leads with ``device_id`` and also serves
+    per-device lookups, so no separate single-column or (device_id, created_at)
+    index is declared.
+
+    When TimescaleDB is available the table is a hypertable partitioned on
+    ``created_at`` (1-day chunks, see migration 006). The database primary key
+    is then (id, created_at) and metric_metadata has no FK constraint to it;
+    the ORM mapping is the same either way.
+    """
 
     __tablename__ = "metrics"
 
     # Foreign key
-    device_id: Mapped[int] = mapped_column(ForeignKey("devices.id"), index=True)
+    device_id: Mapped[int] = mapped_column(ForeignKey("devices.id"))
 
     # Metric info
-    metric_type: Mapped[MetricType] = mapped_column(Enum(MetricType))
+    metric_type: Mapped[MetricType] = mapped_column(StringEnum(MetricType))
     metric_name: Mapped[str] = mapped_column(String(100))
     value: Mapped[float] = mapped_column(Float)
     unit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
 
     # Context (e.g., interface name, BGP peer)
     context: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    metadata_: Mapped[Optional[dict]] = mapped_column("metadata", JSON, nullable=True)
 
-    # Relationship
+    # Relationships
     device: Mapped["Device"] = relationship("Device", back_populates="metrics")
+    # Free-form metadata lives in a sidecar table to keep metric rows narrow;
+    # load with selectinload(Metric.metadata_record) when metadata_ is needed.
+    metadata_record: Mapped[Optional["MetricMetadata"]] = relationship(
+        "MetricMetadata",
+        back_populates="metric",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
 
     # Indexes for efficient time-series queries
     __table_args__ = (
-        Index("ix_metrics_device_type_created", "device_id", "metric_type", "created_at"),
-        Index("ix_metrics_device_created", "device_id", "created_at"),
-        Index("ix_metrics_device_context", "device_id", "metric_type", "context"),
+        # INCLUDE (value) lets the summary aggregates run as index-only scans
+        Index(
+            "ix_metrics_device_type_created",
+            "device_id",
+            "metric_type",
+            "created_at",
+            postgresql_include=["value"],
+        ),
+        # Serves the poller's latest-sample-per-context lookup (DISTINCT ON
+        # ordered by created_at DESC) without a sort
+        Index(
+            "ix_metrics_device_context",
+            "device_id",
+            "metric_type",
+            "context",
+            text("created_at DESC"),
+            postgresql_include=["value"],
+        ),
+        # Rows arrive in created_at order, so a BRIN index serves time-window
+        # scans that aren't scoped to a device (listing, retention cleanup)
+        Index(
+            "ix_metrics_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        enum_check("metric_type", MetricType),
     )
 
+    @property
+    def metadata_(self) -> Optional[dict]:
+        """Metric metadata, or None if the metric has none."""
+        return self.metadata_record.data if self.metadata_record is not None else None
+
+    @metadata_.setter
+    def metadata_(self, value: Optional[dict]) -> None:
+        self.metadata_record = MetricMetadata(data=value) if value is not None else None
+
     def __repr__(self) -> str:
         return f"<Metric(device_id={self.device_id}, type={self.metric_type.value}, value={self.value})>"
 
 
+class MetricMetadata(Base):
+    """Optional free-form metadata for a metric (e.g., interface name)."""
+
+    __tablename__ = "metric_metadata"
+
+    metric_id: Mapped[int] = mapped_column(
+        ForeignKey("metrics.id", ondelete="CASCADE"), unique=True
+    )
+    data: Mapped[dict] = mapped_column(JSONB)
+
+    metric: Mapped["Metric"] = relationship("Metric", back_populates="metadata_record")
+
+    def __repr__(self) -> str:
+        return f"<MetricMetadata(metric_id={self.metric_id})>"
+
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
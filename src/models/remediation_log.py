@@ -4,10 +4,11 @@ import enum
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import String, ForeignKey, Enum, Text, JSON, Integer
+from sqlalchemy import String, ForeignKey, Text, JSON, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
+from src.models.types import StringEnum, enum_check
 
 
 class RemediationStatus(enum.Enum):
@@ -35,7 +36,7 @@ class RemediationLog(Base):
     playbook_name: Mapped[str] = mapped_column(String(100))
     action_type: Mapped[str] = mapped_column(String(50))  # e.g., "interface_enable", "clear_bgp"
     status: Mapped[RemediationStatus] = mapped_column(
-        Enum(RemediationStatus), default=RemediationStatus.PENDING
+        StringEnum(RemediationStatus), default=RemediationStatus.PENDING
     )
 
     # Execution details
@@ -59,6 +60,17 @@ class RemediationLog(Base):
     # Relationships
     device: Mapped["Device"] = relationship("Device", back_populates="remediation_logs")
 
+    __table_args__ = (
+        enum_check("status", RemediationStatus),
+        # Partial index: only pending/running rows, so it stays small as history grows
+        Index(
+            "ix_remediation_logs_active",
+            "device_id",
+            "status",
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<RemediationLog(id={self.id}, playbook={self.playbook_name}, status={self.status.value})>"
 
@@ -0,0 +1,58 @@
+"""Custom column types shared by the database models."""
+
+import enum
+from typing import Any, Optional
+
+import orjson
+from sqlalchemy import CheckConstraint, String
+from sqlalchemy.types import TypeDecorator
+
+
+class StringEnum(TypeDecorator):
+    """Store a Python enum as its ``.value`` in a plain VARCHAR column.
+
+    Unlike ``sqlalchemy.Enum`` this does not create a PostgreSQL enum type, so
+    adding a member only needs a CHECK constraint update rather than
+    ``ALTER TYPE``. Pair it with :func:`enum_check` in ``__table_args__``.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], length: int = 32):
+        super().__init__(length)
+        self.enum_class = enum_class
+        self._by_value = {member.value: member for member in enum_class}
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            return value.value
+        # Accept raw values but reject anything that is not a member
+        return self.enum_class(value).value
+
+    def process_result_value(self, value: Optional[str], dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        member = self._by_value.get(value)
+        return member if member is not None else self.enum_class(value)
+
+
+def enum_check(column: str, enum_class: type[enum.Enum]) -> CheckConstraint:
+    """Build a CHECK constraint limiting a StringEnum column to the enum's values."""
+    values = ", ".join(f"'{member.value}'" for member in enum_class)
+    return CheckConstraint(f"{column} IN ({values})", name=column)
+
+
+def json_serializer(value: Any) -> str:
+    """orjson-backed replacement for ``json.dumps`` on JSON/JSONB columns.
+
+    Passed to ``create_async_engine(json_serializer=...)``. OPT_NON_STR_KEYS
+    keeps the stdlib behaviour of coercing int/enum dict keys to strings.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# orjson.loads accepts str and bytes, matching json.loads
+json_deserializer = orjson.loads
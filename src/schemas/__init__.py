@@ -1,10 +1,26 @@
 """Pydantic schemas for API request/response models."""
 
+from typing import Any, Iterable
+
+from pydantic import TypeAdapter
+
 from src.schemas.user import UserCreate, UserResponse, UserLogin, Token, TokenData
 from src.schemas.device import DeviceCreate, DeviceUpdate, DeviceResponse
 from src.schemas.alert import AlertCreate, AlertUpdate, AlertResponse
 from src.schemas.metric import MetricCreate, MetricResponse
 
+# Module-level adapters for list endpoints: the whole result set is validated
+# from ORM rows and dumped to JSON in single pydantic-core calls.
+DEVICE_LIST_ADAPTER = TypeAdapter(list[DeviceResponse])
+ALERT_LIST_ADAPTER = TypeAdapter(list[AlertResponse])
+METRIC_LIST_ADAPTER = TypeAdapter(list[MetricResponse])
+
+
+def dump_list_json(adapter: TypeAdapter, rows: Iterable[Any]) -> bytes:
+    """Validate ORM rows through a list adapter and serialize them to JSON."""
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
 __all__ = [
     "UserCreate",
     "UserResponse",
@@ -19,4 +35,8 @@ __all__ = [
     "AlertResponse",
     "MetricCreate",
     "MetricResponse",
+    "DEVICE_LIST_ADAPTER",
+    "ALERT_LIST_ADAPTER",
+    "METRIC_LIST_ADAPTER",
+    "dump_list_json",
 ]
@@ -3,9 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, IPvAnyAddress
+from pydantic import BaseModel, IPvAnyAddress, field_validator
 
-from src.models.device import DeviceType
+from src.models.device import DEVICE_TYPE_BY_VALUE, DeviceType, PollingMode
 
 
 class DeviceCreate(BaseModel):
@@ -22,11 +22,17 @@ class DeviceCreate(BaseModel):
     snmp_version: int = 2
     ssh_port: int = 22
     netconf_port: int = 830
+    polling_mode: PollingMode = PollingMode.PULL
     netbox_id: Optional[int] = None
     location: Optional[str] = None
     description: Optional[str] = None
     tags: Optional[dict] = None
 
+    @field_validator("device_type", mode="before")
+    @classmethod
+    def _lookup_device_type(cls, v):
+        return DEVICE_TYPE_BY_VALUE.get(v, v) if isinstance(v, str) else v
+
 
 class DeviceUpdate(BaseModel):
     """Schema for updating a device."""
@@ -43,10 +49,16 @@ class DeviceUpdate(BaseModel):
     snmp_version: Optional[int] = None
     ssh_port: Optional[int] = None
     netconf_port: Optional[int] = None
+    polling_mode: Optional[PollingMode] = None
     location: Optional[str] = None
     description: Optional[str] = None
     tags: Optional[dict] = None
 
+    @field_validator("device_type", mode="before")
+    @classmethod
+    def _lookup_device_type(cls, v):
+        return DEVICE_TYPE_BY_VALUE.get(v, v) if isinstance(v, str) else v
+
 
 class DeviceResponse(BaseModel):
     """Schema for device response."""
@@ -61,10 +73,11 @@ class DeviceResponse(BaseModel):
     os_version: Optional[str]
     is_active: bool
     is_reachable: bool
-    last_seen: Optional[str]
+    last_seen: Optional[datetime]
     snmp_version: int
     ssh_port: int
     netconf_port: int
+    polling_mode: PollingMode
     netbox_id: Optional[int]
     location: Optional[str]
     description: Optional[str]
@@ -3,9 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
-from src.models.metric import MetricType
+from src.models.metric import METRIC_TYPE_BY_VALUE, MetricType
 
 
 class MetricCreate(BaseModel):
@@ -19,6 +19,11 @@ class MetricCreate(BaseModel):
     context: Optional[str] = None
     metadata_: Optional[dict] = None
 
+    @field_validator("metric_type", mode="before")
+    @classmethod
+    def _lookup_metric_type(cls, v):
+        return METRIC_TYPE_BY_VALUE.get(v, v) if isinstance(v, str) else v
+
 
 class MetricResponse(BaseModel):
     """Schema for metric response."""
@@ -1,9 +1,22 @@
 """Celery tasks for background processing."""
 
+import asyncio
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import get_settings
+from src.models.types import json_deserializer, json_serializer
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 celery_app = Celery(
@@ -30,6 +43,10 @@ celery_app.conf.beat_schedule = {
         "task": "src.tasks.polling.poll_all_devices",
         "schedule": settings.polling_interval_seconds,
     },
+    "poll-event-devices-safety-net": {
+        "task": "src.tasks.polling.poll_event_devices",
+        "schedule": settings.event_device_poll_interval_seconds,
+    },
     "sync-netbox-every-5-minutes": {
         "task": "src.tasks.polling.sync_netbox_devices",
         "schedule": 300.0,
@@ -44,3 +61,164 @@ celery_app.conf.beat_schedule = {
         "schedule": 300.0,  # BGP/OSPF polling every 5 minutes (SSH is slow)
     },
 }
+
+
+# One event loop per worker process, kept open across tasks so pooled
+# asyncpg connections (bound to the loop they were opened on) survive
+# between task runs instead of being torn down with a per-task loop.
+_worker_loop = None
+# Coroutine functions run on the worker loop just before it closes
+_loop_shutdown_hooks = []
+
+# Engines and session factories shared by every task module in the worker.
+# Device polls get their own engine: it skips pre-ping, which only
+# poll_device_with_session (with its reconnect retry) can do without.
+_async_engine = None
+_async_session_factory = None
+_polling_engine = None
+_polling_session_factory = None
+# The polling pool: one connection per concurrent poll plus one for the
+# streamed device list
+POOL_SIZE = settings.poll_concurrency + 1
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop where available and enabled, else the default loop."""
+    if uvloop and settings.use_uvloop:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    """Create the worker's event loop when a pool process starts."""
+    global _worker_loop
+    _worker_loop = _new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    # Build the engines and session factories up front; no connections are opened yet
+    get_async_session()
+    get_polling_session()
+
+
+def on_worker_loop_shutdown(func):
+    """Register a coroutine function to run on the worker loop before it closes.
+
+    Task modules use this to dispose of their engines, so pooled connections
+    are closed cleanly on the loop they were opened on.
+    """
+    _loop_shutdown_hooks.append(func)
+    return func
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs):
+    """Run shutdown hooks, finalize async generators and close the loop on pool process exit."""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        for hook in _loop_shutdown_hooks:
+            try:
+                _worker_loop.run_until_complete(hook())
+            except Exception as e:
+                logger.warning(f"Worker loop shutdown hook {hook.__name__} failed: {e}")
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+        _worker_loop.close()
+    _worker_loop = None
+
+
+def get_async_engine():
+    """Get the worker's singleton async database engine.
+
+    Pooled connections are pre-pinged on checkout, so tasks without a
+    reconnect path of their own don't fail on a connection the database
+    has since dropped.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+        )
+    return _async_engine
+
+
+def get_async_session():
+    """Get the worker's singleton async session factory."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), class_=AsyncSession, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+def get_polling_engine():
+    """Get the worker's singleton async database engine for device polls."""
+    global _polling_engine
+    if _polling_engine is None:
+        _polling_engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            # No pre-ping: it costs a SELECT 1 per checkout (per device, per
+            # poll cycle). Connections are recycled instead, and a device poll
+            # that hits a dead one is retried in poll_device_with_session.
+            pool_pre_ping=False,
+            poolclass=AsyncAdaptedQueuePool,
+            # Each concurrent poll holds a connection for its whole session,
+            # so the pool is sized to exactly what a poll cycle can use
+            pool_size=POOL_SIZE,
+            max_overflow=0,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            # Reuse the most recently returned connection so idle extras can
+            # age out under pool_recycle rather than all staying warm
+            pool_use_lifo=True,
+            # Short OLTP queries gain nothing from JIT compilation
+            connect_args={"server_settings": {"jit": "off"}},
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+        )
+    return _polling_engine
+
+
+def get_polling_session():
+    """Get the session factory for poll_devices and its device polls.
+
+    Only for callers that go through poll_device_with_session, which
+    retries on a dead connection; everything else uses get_async_session().
+    """
+    global _polling_session_factory
+    if _polling_session_factory is None:
+        _polling_session_factory = async_sessionmaker(
+            get_polling_engine(), class_=AsyncSession, expire_on_commit=False
+        )
+    return _polling_session_factory
+
+
+@on_worker_loop_shutdown
+async def dispose_async_engine():
+    """Close the engines' pooled connections before the worker's loop closes."""
+    global _async_engine, _async_session_factory, _polling_engine, _polling_session_factory
+    for engine in (_async_engine, _polling_engine):
+        if engine is not None:
+            await engine.dispose()
+    _async_engine = _async_session_factory = None
+    _polling_engine = _polling_session_factory = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker's event loop, creating it outside a prefork pool."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = _new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+def run_async(coro):
+    """Run an async coroutine from sync Celery task on the worker's loop."""
+    return get_worker_loop().run_until_complete(coro)
@@ -2,53 +2,48 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Optional
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-
-from src.tasks import celery_app
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import AsyncIterable, Mapping, Optional
+
+from celery import chord
+from sqlalchemy import Row, bindparam, delete, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.tasks import POOL_SIZE, celery_app, get_async_session, get_polling_session, run_async
 from src.config import get_settings
-from src.models.device import Device, DeviceType
-from src.models.metric import Metric, MetricType
+from src.models.device import DEVICE_TYPE_BY_VALUE, Device, DeviceType, PollingMode
+from src.models.metric import Metric, MetricMetadata, MetricType
 from src.models.alert import Alert, AlertSeverity, AlertStatus
-from src.drivers import ConnectionParams, DevicePlatform, SNMPDriver
-from src.core.health_checks import ping_host
+from src.models.base import utc_now
+from src.models.types import json_serializer
+from src.drivers import ConnectionParams, DevicePlatform, DriverResult, SNMPDriver
+from src.core.health_checks import PingResult, ping_host, ping_hosts
 from src.integrations.netbox import NetBoxSyncService
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Singleton engine and session factory for connection pooling
-_async_engine = None
-_async_session_factory = None
-
-
-def get_async_engine():
-    """Get singleton async database engine for Celery tasks."""
-    global _async_engine
-    if _async_engine is None:
-        _async_engine = create_async_engine(
-            settings.database_url,
-            echo=settings.debug,
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-        )
-    return _async_engine
+# Maximum concurrent device polls to avoid overwhelming the network/database.
+# The polling engine's pool (POOL_SIZE) is sized from the same setting, so
+# the two can't drift apart.
+MAX_CONCURRENT_POLLS = settings.poll_concurrency
 
 
-def get_async_session():
-    """Get singleton async session factory."""
-    global _async_session_factory
-    if _async_session_factory is None:
-        engine = get_async_engine()
-        _async_session_factory = async_sessionmaker(
-            engine, class_=AsyncSession, expire_on_commit=False
-        )
-    return _async_session_factory
-
+# Device lookups by id, built once and bound per call
+DEVICE_BY_ID = select(Device).where(Device.id == bindparam("device_id"))
+DEVICE_CONNECTIVITY_BY_ID = select(
+    Device.name,
+    Device.ip_address,
+    Device.snmp_community,
+    Device.device_type,
+).where(Device.id == bindparam("device_id"))
 
 # Alert thresholds
 ALERT_THRESHOLDS = {
@@ -57,61 +52,164 @@ ALERT_THRESHOLDS = {
     MetricType.PING_LOSS: {"warning": 10.0, "critical": 50.0},
 }
 
-
-def run_async(coro):
-    """Run an async coroutine from sync Celery task."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-async def store_metric(
-    db: AsyncSession,
+# ALERT_THRESHOLDS flattened for check_and_create_alert:
+# metric type -> (warning, critical, alert title)
+THRESHOLD_LEVELS: dict[MetricType, tuple[float, float, str]] = {
+    metric_type: (
+        levels["warning"],
+        levels["critical"],
+        f"{metric_type.value.replace('_', ' ').title()} Alert",
+    )
+    for metric_type, levels in ALERT_THRESHOLDS.items()
+}
+# Indexed by (value >= critical) * 2 + (value >= warning); reaching the
+# critical threshold is critical whatever the warning comparison says
+SEVERITY_BY_LEVEL = (None, AlertSeverity.WARNING, AlertSeverity.CRITICAL, AlertSeverity.CRITICAL)
+
+# Interfaces never alerted on (management interfaces and loopbacks)
+SKIP_INTERFACE_RE = re.compile(r"Loopback|Null|VoIP-Null|Management|mgmt", re.IGNORECASE)
+# Physical interface types that get interface-down alerts
+PHYSICAL_INTERFACE_RE = re.compile(
+    r"GigabitEthernet|FastEthernet|Ethernet|Serial|Tunnel", re.IGNORECASE
+)
+
+
+# A buffered metric row: (device_id, metric_type, metric_name, value, unit,
+# context, created_at, metadata)
+MetricRow = tuple[
+    int, str, str, float, Optional[str], Optional[str], datetime, Optional[dict]
+]
+
+# Columns written by COPY; updated_at takes its server default. created_at is
+# the poll's own timestamp, so a stored counter sample and the rate computed
+# from it against the next poll use the same clock.
+METRIC_COPY_COLUMNS = (
+    "id", "device_id", "metric_type", "metric_name", "value", "unit", "context", "created_at"
+)
+
+
+def buffer_metric(
+    metrics_buffer: list[MetricRow],
     device_id: int,
     metric_type: MetricType,
     value: float,
     metric_name: str,
+    *,
+    created_at: datetime,
     unit: Optional[str] = None,
     context: Optional[str] = None,
     metadata: Optional[dict] = None,
-) -> Metric:
-    """Store a metric in the database."""
-    metric = Metric(
-        device_id=device_id,
-        metric_type=metric_type,
-        metric_name=metric_name,
-        value=value,
-        unit=unit,
-        context=context,
-        metadata_=metadata,
+) -> None:
+    """Append a metric row to the poll's buffer.
+
+    The buffer is written with copy_metrics() at the end of the poll, so the
+    metrics go out in one COPY instead of interleaving with (and being
+    autoflushed by) the alert queries. ``created_at`` is when the value was
+    sampled.
+    """
+    metrics_buffer.append(
+        (device_id, metric_type.value, metric_name, value, unit, context, created_at, metadata)
+    )
+
+
+async def copy_metrics(db: AsyncSession, rows: list[MetricRow]) -> None:
+    """Write buffered metric rows using asyncpg's binary COPY.
+
+    Metric ids are drawn from the sequence up front so the metadata sidecar
+    rows can be copied alongside in the same transaction.
+    """
+    if not rows:
+        return
+
+    conn = await db.connection()
+    result = await conn.execute(
+        text(
+            "SELECT nextval(pg_get_serial_sequence('metrics', 'id')) "
+            "FROM generate_series(1, :n)"
+        ),
+        {"n": len(rows)},
     )
-    db.add(metric)
-    await db.flush()
-    return metric
+    ids = result.scalars().all()
+
+    raw = (await conn.get_raw_connection()).driver_connection
+    await raw.copy_records_to_table(
+        "metrics",
+        records=[(metric_id, *row[:-1]) for metric_id, row in zip(ids, rows)],
+        columns=METRIC_COPY_COLUMNS,
+    )
+
+    metadata_records = [
+        (metric_id, json_serializer(row[-1]))
+        for metric_id, row in zip(ids, rows)
+        if row[-1] is not None
+    ]
+    if metadata_records:
+        await raw.copy_records_to_table(
+            "metric_metadata",
+            records=metadata_records,
+            columns=("metric_id", "data"),
+        )
+
+
+async def commit_phase(
+    db: AsyncSession, metrics_buffer: list[MetricRow], state: "DevicePollState"
+) -> None:
+    """Write the buffered metrics and commit the current poll phase.
+
+    A poll commits after the ping checks and again after the scalar SNMP
+    metrics. Transactions stay short, and a failure later in the poll
+    doesn't roll back what was already recorded: a poll that fails in the
+    interface phase leaves that cycle's ping and CPU/memory samples without
+    interface samples, which readers treat like any missed poll.
+    """
+    await copy_metrics(db, metrics_buffer)
+    metrics_buffer.clear()
+    await state.commit(db)
+    state.phase_committed()
+
+
+# How far back to look for the previous counter sample when calculating rates
+PREVIOUS_COUNTER_LOOKBACK = timedelta(hours=1)
+# Width of the octet counters walk_interface_counters() reads (ifXTable Counter64)
+INTERFACE_COUNTER_BITS = 64
+# metric_name of the stored octet counter samples. Samples from before the
+# switch to 64-bit counters are named interface_<n>_in_octets; the name
+# tells them apart, so a 32-bit previous value is never diffed against a
+# 64-bit current one.
+IN_OCTETS_NAME = "interface_{}_hc_in_octets"
+OUT_OCTETS_NAME = "interface_{}_hc_out_octets"
 
 
-async def get_previous_metric(
+async def get_previous_metrics_bulk(
     db: AsyncSession,
     device_id: int,
-    metric_type: MetricType,
-    context: str,
-) -> Optional[Metric]:
-    """Get the most recent previous metric for rate calculation."""
+    metric_types: list[MetricType],
+    now: Optional[datetime] = None,
+) -> dict[tuple[MetricType, str], Row]:
+    """Get the most recent metric per (metric_type, context) for rate calculation.
+
+    One DISTINCT ON query replaces a per-interface lookup for each counter.
+    Returns rows with ``metric_name``, ``value`` and ``created_at`` keyed by
+    (metric_type, context).
+    """
     stmt = (
-        select(Metric)
+        select(
+            Metric.metric_type,
+            Metric.context,
+            Metric.metric_name,
+            Metric.value,
+            Metric.created_at,
+        )
         .where(
             Metric.device_id == device_id,
-            Metric.metric_type == metric_type,
-            Metric.context == context,
+            Metric.metric_type.in_(metric_types),
+            Metric.created_at >= (now or datetime.utcnow()) - PREVIOUS_COUNTER_LOOKBACK,
         )
-        .order_by(Metric.created_at.desc())
-        .limit(1)
+        .order_by(Metric.metric_type, Metric.context, Metric.created_at.desc())
+        .distinct(Metric.metric_type, Metric.context)
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return {(row.metric_type, row.context): row for row in result}
 
 
 def calculate_rate_bps(
@@ -119,10 +217,12 @@ def calculate_rate_bps(
     previous_octets: float,
     current_time: datetime,
     previous_time: datetime,
+    counter_bits: int = 64,
 ) -> Optional[float]:
     """Calculate traffic rate in bits per second from octet counter delta.
 
-    Handles 32-bit counter wraps (max 4,294,967,295 bytes).
+    Handles counter wraps by taking the delta modulo 2**counter_bits: pass
+    32 for ifInOctets/ifOutOctets (Counter32) and 64 for ifHC* counters.
     Returns None if calculation is invalid.
     """
     if previous_time is None or current_time is None:
@@ -133,13 +233,8 @@ def calculate_rate_bps(
     if time_delta <= 0:
         return None
 
-    # Calculate octet delta, handling 32-bit counter wrap
-    MAX_32BIT = 4294967295
-    if current_octets >= previous_octets:
-        octet_delta = current_octets - previous_octets
-    else:
-        # Counter wrapped
-        octet_delta = (MAX_32BIT - previous_octets) + current_octets
+    # Octet delta, wrapped to the counter's width
+    octet_delta = (int(current_octets) - int(previous_octets)) & ((1 << counter_bits) - 1)
 
     # Convert to bits per second (octets * 8 / seconds)
     rate_bps = (octet_delta * 8) / time_delta
@@ -147,6 +242,41 @@ def calculate_rate_bps(
     return rate_bps
 
 
+async def insert_alert(db: AsyncSession, **values) -> Optional[Alert]:
+    """Insert an alert unless an equivalent open one already exists.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING against the alerts table's
+    one-open-alert-per-source unique index, so concurrent polls of the same
+    device cannot create duplicates. Returns None if the insert was skipped.
+    """
+    stmt = pg_insert(Alert).values(**values).on_conflict_do_nothing().returning(Alert)
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def get_open_alerts(db: AsyncSession, device_id: int) -> dict[str, list[Alert]]:
+    """Get the device's active or acknowledged alerts grouped by alert_type.
+
+    Fetched once per poll; the threshold, reachability and interface-down
+    checks all branch on this instead of each querying the alerts table.
+    """
+    stmt = select(Alert).where(
+        Alert.device_id == device_id,
+        Alert.status.in_([AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]),
+    )
+    result = await db.execute(stmt)
+    alerts_by_type: dict[str, list[Alert]] = defaultdict(list)
+    for alert in result.scalars().all():
+        alerts_by_type[alert.alert_type].append(alert)
+    return alerts_by_type
+
+
+def first_alert(alerts_by_type: dict[str, list[Alert]], alert_type: str) -> Optional[Alert]:
+    """Get the first open alert of a type from get_open_alerts() results."""
+    alerts = alerts_by_type.get(alert_type)
+    return alerts[0] if alerts else None
+
+
 async def check_interface_down_alert(
     db: AsyncSession,
     device_id: int,
@@ -155,49 +285,36 @@ async def check_interface_down_alert(
     status: str,
     device_name: str,
     admin_status: str = "up",
+    existing_alert: Optional[Alert] = None,
+    now: Optional[datetime] = None,
 ) -> Optional[Alert]:
     """Check if interface is down and create/resolve alert accordingly.
 
     Only creates alerts for non-management interfaces that go down.
     Skips interfaces that are administratively shutdown.
     Resolves existing alerts if interface is now admin-down.
+
+    ``existing_alert`` is this interface's active or acknowledged alert, if
+    any, from the alerts looked up once per device by get_open_alerts().
+    ``now`` is the poll's timestamp, used when resolving alerts.
     """
+    now = now or datetime.utcnow()
     # Skip management interfaces and loopbacks
-    skip_patterns = ["Loopback", "Null", "VoIP-Null", "Management", "mgmt"]
-    if any(pattern.lower() in if_name.lower() for pattern in skip_patterns):
+    if SKIP_INTERFACE_RE.search(if_name):
         return None
 
     # Also skip interfaces that are likely not relevant (VLAN interfaces, etc.)
     # We only care about physical interfaces like GigabitEthernet, FastEthernet, etc.
-    physical_patterns = ["GigabitEthernet", "FastEthernet", "Ethernet", "Serial", "Tunnel"]
-    is_physical = any(pattern.lower() in if_name.lower() for pattern in physical_patterns)
-    if not is_physical:
+    if not PHYSICAL_INTERFACE_RE.search(if_name):
         return None
 
     alert_type = "interface_down"
 
-    # Check for existing active OR acknowledged alert for this interface
-    # We don't want to create duplicate alerts if user already acknowledged one
-    stmt = select(Alert).where(
-        Alert.device_id == device_id,
-        Alert.alert_type == alert_type,
-        Alert.status.in_([AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]),
-    )
-    result = await db.execute(stmt)
-    existing_alerts = result.scalars().all()
-
-    # Find alert matching this specific interface
-    existing_alert = None
-    for alert in existing_alerts:
-        if alert.context and alert.context.get("if_index") == if_index:
-            existing_alert = alert
-            break
-
     # If interface is administratively shutdown, resolve any existing alert and skip
     if admin_status == "down":
         if existing_alert:
             existing_alert.status = AlertStatus.RESOLVED
-            existing_alert.resolved_at = datetime.utcnow()
+            existing_alert.resolved_at = now
             existing_alert.resolution_notes = f"Interface {if_name} was administratively shutdown (auto-resolved)"
             logger.info(f"Alert auto-resolved: Interface {if_name} on {device_name} was admin shutdown")
         return None
@@ -208,7 +325,8 @@ async def check_interface_down_alert(
             return existing_alert
         else:
             # Create new interface down alert
-            alert = Alert(
+            alert = await insert_alert(
+                db,
                 device_id=device_id,
                 title=f"Interface Down: {if_name}",
                 message=f"Interface {if_name} on {device_name} is down",
@@ -217,16 +335,15 @@ async def check_interface_down_alert(
                 alert_type=alert_type,
                 context={"if_index": if_index, "interface": if_name},
             )
-            db.add(alert)
-            await db.flush()
-            logger.warning(
-                f"Alert created: Interface {if_name} down on device {device_name}"
-            )
+            if alert:
+                logger.warning(
+                    f"Alert created: Interface {if_name} down on device {device_name}"
+                )
             return alert
     elif status == "up" and existing_alert:
         # Interface came back up - resolve the alert (whether it was active or acknowledged)
         existing_alert.status = AlertStatus.RESOLVED
-        existing_alert.resolved_at = datetime.utcnow()
+        existing_alert.resolved_at = now
         existing_alert.resolution_notes = f"Interface {if_name} is now up (auto-resolved)"
         logger.info(f"Alert auto-resolved: Interface {if_name} on {device_name} is now up")
 
@@ -239,27 +356,21 @@ async def check_and_create_alert(
     metric_type: MetricType,
     value: float,
     context: Optional[str] = None,
+    existing_alert: Optional[Alert] = None,
+    now: Optional[datetime] = None,
 ) -> Optional[Alert]:
-    """Check if metric exceeds thresholds and create alert if needed."""
-    thresholds = ALERT_THRESHOLDS.get(metric_type)
-    if not thresholds:
-        return None
+    """Check if metric exceeds thresholds and create alert if needed.
 
-    # Check for existing active or acknowledged alert
-    # Don't create duplicates if user already acknowledged one
-    stmt = select(Alert).where(
-        Alert.device_id == device_id,
-        Alert.alert_type == metric_type.value,
-        Alert.status.in_([AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]),
-    )
-    result = await db.execute(stmt)
-    existing_alert = result.scalar_one_or_none()
+    ``existing_alert`` is the device's active or acknowledged alert of this
+    type, if any; an acknowledged one is updated rather than duplicated.
+    ``now`` is the poll's timestamp, used when resolving the alert.
+    """
+    levels = THRESHOLD_LEVELS.get(metric_type)
+    if levels is None:
+        return None
 
-    severity = None
-    if value >= thresholds["critical"]:
-        severity = AlertSeverity.CRITICAL
-    elif value >= thresholds["warning"]:
-        severity = AlertSeverity.WARNING
+    warning, critical, title = levels
+    severity = SEVERITY_BY_LEVEL[(value >= critical) * 2 + (value >= warning)]
 
     if severity:
         if existing_alert:
@@ -273,216 +384,379 @@ async def check_and_create_alert(
             return existing_alert
         else:
             # Create new alert
-            alert = Alert(
+            alert = await insert_alert(
+                db,
                 device_id=device_id,
-                title=f"{metric_type.value.replace('_', ' ').title()} Alert",
+                title=title,
                 message=f"{metric_type.value}: {value:.1f}% exceeds {severity.value} threshold",
                 severity=severity,
                 status=AlertStatus.ACTIVE,
                 alert_type=metric_type.value,
                 context={"value": value, "interface": context} if context else {"value": value},
             )
-            db.add(alert)
-            await db.flush()
-            logger.warning(
-                f"Alert created: {alert.title} for device {device_id} - {value:.1f}%"
-            )
+            if alert:
+                logger.warning(
+                    f"Alert created: {alert.title} for device {device_id} - {value:.1f}%"
+                )
             return alert
     elif existing_alert:
         # Value is now below threshold - resolve alert
         existing_alert.status = AlertStatus.RESOLVED
-        existing_alert.resolved_at = datetime.utcnow()
+        existing_alert.resolved_at = now or datetime.utcnow()
         existing_alert.resolution_notes = f"Metric returned to normal: {value:.1f}%"
         logger.info(f"Alert resolved for device {device_id}: {metric_type.value}")
 
     return None
 
 
-async def poll_device_metrics(db: AsyncSession, device: Device) -> dict:
-    """Poll metrics from a single device using SNMP."""
-    results = {
-        "device_id": device.id,
-        "device_name": device.name,
-        "success": False,
-        "metrics": [],
-        "alerts": [],
-        "errors": [],
-    }
+async def ping_with_retry(ip_address: str) -> PingResult:
+    """Ping a device, retrying once to ride out momentary network glitches.
 
-    # Ping check - use 3 pings with 3s timeout for better accuracy
-    # This balances speed with reliability (avoids false positives from single dropped packet)
-    ping_result = await ping_host(device.ip_address, count=3, timeout=3)
+    Uses 3 pings with a 3s timeout, which balances speed with reliability
+    (avoids false positives from a single dropped packet). The retry starts
+    0.5s after the first attempt and runs alongside it rather than after it
+    fails, so an unreachable device costs one ping timeout instead of two.
+    The first successful result wins and the other attempt is cancelled.
+    """
 
-    # Retry once if ping fails (helps with momentary network glitches)
-    if not ping_result.success:
-        await asyncio.sleep(0.5)  # Brief delay before retry
-        ping_result = await ping_host(device.ip_address, count=3, timeout=3)
+    async def delayed_retry() -> PingResult:
+        await asyncio.sleep(0.5)
+        return await ping_host(ip_address, count=3, timeout=3)
 
-    if ping_result.success:
-        results["metrics"].append(
-            {
-                "type": MetricType.PING_LATENCY.value,
-                "value": ping_result.latency_ms or 0,
+    attempts = [
+        asyncio.create_task(ping_host(ip_address, count=3, timeout=3)),
+        asyncio.create_task(delayed_retry()),
+    ]
+    ping_result = None
+    try:
+        for attempt in asyncio.as_completed(attempts):
+            ping_result = await attempt
+            if ping_result.success:
+                break
+    finally:
+        for task in attempts:
+            task.cancel()
+    return ping_result
+
+
+@dataclass
+class SNMPPollData:
+    """Raw SNMP results collected for one device poll."""
+
+    cpu: DriverResult
+    memory: DriverResult
+    names: DriverResult
+    status: DriverResult
+    admin_status: DriverResult
+    counters: DriverResult
+    # When the counter walk started; the interface rows are stamped with this
+    # so rates are computed between actual counter reads
+    counters_at: datetime
+
+
+def collect_snmp_data(snmp_driver: SNMPDriver) -> SNMPPollData:
+    """Read everything a device poll needs over SNMP (blocking).
+
+    Run via asyncio.to_thread so the event loop keeps serving other devices'
+    polls. The reads stay sequential because a pysnmp SnmpEngine is not safe
+    to share between threads.
+    """
+    cpu = snmp_driver.get_cpu_utilization()
+    memory = snmp_driver.get_memory_utilization()
+    names = snmp_driver.get_interface_names()
+    status = snmp_driver.get_interface_status()
+    admin_status = snmp_driver.get_interface_admin_status()
+    counters_at = datetime.utcnow()
+    counters = snmp_driver.walk_interface_counters(
+        max_repetitions=settings.snmp_max_repetitions
+    )
+    return SNMPPollData(
+        cpu=cpu,
+        memory=memory,
+        names=names,
+        status=status,
+        admin_status=admin_status,
+        counters=counters,
+        counters_at=counters_at,
+    )
+
+
+# Phases of a device poll that commit their own transaction, in order
+POLL_PHASE_PING = 1
+POLL_PHASE_SCALAR = 2
+
+
+@dataclass
+class DevicePollState:
+    """What a device poll has done so far, kept across a database reconnect.
+
+    poll_device_with_session re-runs a poll whose connection dropped on a
+    fresh session, passing the same state back in. The ping and SNMP reads
+    are reused instead of repeated, and phases that already committed are
+    skipped, so their metrics aren't written twice.
+    """
+
+    results: dict
+    now: datetime = field(default_factory=datetime.utcnow)
+    ping_result: Optional[PingResult] = None
+    snmp_data: Optional[SNMPPollData] = None
+    committed_phases: int = 0
+    # Lengths of results' metrics/alerts/errors lists as of the last commit
+    committed_counts: tuple[int, int, int] = (0, 0, 0)
+    # Set while a COMMIT is in flight; left set if it fails, since the
+    # transaction may have been committed before the connection dropped
+    commit_in_doubt: bool = False
+
+    @classmethod
+    def for_device(cls, device) -> "DevicePollState":
+        return cls(
+            results={
+                "device_id": device.id,
+                "device_name": device.name,
+                "success": False,
+                "metrics": [],
+                "alerts": [],
+                "errors": [],
             }
         )
-        results["metrics"].append(
-            {"type": MetricType.PING_LOSS.value, "value": ping_result.packet_loss}
+
+    async def commit(self, db: AsyncSession) -> None:
+        """Commit the poll's current transaction."""
+        self.commit_in_doubt = True
+        await db.commit()
+        self.commit_in_doubt = False
+
+    def phase_committed(self) -> None:
+        """Record that the next phase's writes are committed."""
+        self.committed_phases += 1
+        self.committed_counts = (
+            len(self.results["metrics"]),
+            len(self.results["alerts"]),
+            len(self.results["errors"]),
         )
 
-        # Store ping metrics
-        if ping_result.latency_ms is not None:
-            await store_metric(
+    def rewind(self) -> None:
+        """Drop results recorded after the last commit, before a re-run."""
+        metrics, alerts, errors = self.committed_counts
+        del self.results["metrics"][metrics:]
+        del self.results["alerts"][alerts:]
+        del self.results["errors"][errors:]
+        self.results["success"] = False
+
+
+# Scalar percentage metrics: (metric type, SNMPPollData field, keys to try
+# in the driver's result dict, in order of preference)
+SCALAR_METRICS = (
+    (MetricType.CPU_UTILIZATION, "cpu", ("cpu_5min", "cpu_1min")),
+    (MetricType.MEMORY_UTILIZATION, "memory", ("memory_utilization",)),
+)
+
+
+def scalar_value(data: dict, keys: tuple[str, ...]) -> Optional[float]:
+    """Pick the first of ``keys`` present in ``data`` as a float.
+
+    Falls back to 0 when none are present. Returns None for values that
+    can't be used, such as SNMP "No Such Instance" strings from
+    unsupported OIDs.
+    """
+    raw = next((data[key] for key in keys if key in data), 0)
+    if isinstance(raw, str) and "No Such" in raw:
+        return None
+    return to_float(raw)
+
+
+def to_float(raw) -> Optional[float]:
+    """Convert an SNMP value (number or numeric string) to float, or None."""
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+async def poll_device_metrics(
+    db: AsyncSession,
+    device: Device,
+    ping_result: Optional[PingResult] = None,
+    state: Optional[DevicePollState] = None,
+) -> dict:
+    """Poll metrics from a single device using SNMP.
+
+    ``ping_result`` is the device's entry from a fleet-wide ping_hosts()
+    run, if there was one; without a successful result the device is
+    pinged on its own.
+
+    ``state`` resumes an earlier attempt at this poll (see DevicePollState).
+    Database errors are raised rather than recorded in the results, so the
+    caller can retry on a new connection.
+    """
+    if state is None:
+        state = DevicePollState.for_device(device)
+    else:
+        state.rewind()
+    results = state.results
+    metrics_buffer: list[MetricRow] = []
+    # The poll's timestamp for the ping and scalar metrics, alert
+    # resolutions and last_seen. Interface counters and their rates use
+    # SNMPPollData.counters_at, taken right before the counter walk.
+    now = state.now
+
+    # Ping check, with a staggered retry racing the first attempt
+    if state.ping_result is None:
+        if ping_result is None or not ping_result.success:
+            ping_result = await ping_with_retry(device.ip_address)
+        state.ping_result = ping_result
+    ping_result = state.ping_result
+
+    # All open alerts for the device, fetched once for every check below
+    open_alerts = await get_open_alerts(db, device.id)
+
+    if state.committed_phases < POLL_PHASE_PING:
+        if ping_result.success:
+            results["metrics"].append(
+                {
+                    "type": MetricType.PING_LATENCY.value,
+                    "value": ping_result.latency_ms or 0,
+                }
+            )
+            results["metrics"].append(
+                {"type": MetricType.PING_LOSS.value, "value": ping_result.packet_loss}
+            )
+
+            # Store ping metrics
+            if ping_result.latency_ms is not None:
+                buffer_metric(
+                    metrics_buffer,
+                    device.id,
+                    MetricType.PING_LATENCY,
+                    ping_result.latency_ms,
+                    "ping_latency",
+                    unit="ms",
+                    created_at=now,
+                )
+
+            buffer_metric(
+                metrics_buffer,
+                device.id,
+                MetricType.PING_LOSS,
+                ping_result.packet_loss,
+                "ping_packet_loss",
+                unit="%",
+                created_at=now,
+            )
+
+            # Check for packet loss alert
+            alert = await check_and_create_alert(
                 db,
                 device.id,
-                MetricType.PING_LATENCY,
-                ping_result.latency_ms,
-                "ping_latency",
-                unit="ms",
+                MetricType.PING_LOSS,
+                ping_result.packet_loss,
+                existing_alert=first_alert(open_alerts, MetricType.PING_LOSS.value),
+                now=now,
+            )
+            if alert:
+                results["alerts"].append(alert.id)
+
+            # Resolve any existing device_unreachable alerts since ping succeeded
+            for unreachable_alert in open_alerts.get("device_unreachable", []):
+                unreachable_alert.status = AlertStatus.RESOLVED
+                unreachable_alert.resolved_at = now
+                unreachable_alert.resolution_notes = (
+                    f"Device {device.name} is now responding to ping (auto-resolved)"
+                )
+                logger.info(f"Alert auto-resolved: Device {device.name} is now reachable")
+        else:
+            results["errors"].append(f"Ping failed: {ping_result.error}")
+            # Create unreachable alert
+            existing = any(
+                alert.status == AlertStatus.ACTIVE
+                for alert in open_alerts.get("device_unreachable", [])
             )
 
-        await store_metric(
-            db,
-            device.id,
-            MetricType.PING_LOSS,
-            ping_result.packet_loss,
-            "ping_packet_loss",
-            unit="%",
-        )
+            if not existing:
+                alert = Alert(
+                    device_id=device.id,
+                    title="Device Unreachable",
+                    message=f"Device {device.name} ({device.ip_address}) is not responding to ping",
+                    severity=AlertSeverity.CRITICAL,
+                    status=AlertStatus.ACTIVE,
+                    alert_type="device_unreachable",
+                )
+                db.add(alert)
+                await db.flush()
+                results["alerts"].append(alert.id)
 
-        # Check for packet loss alert
-        alert = await check_and_create_alert(
-            db, device.id, MetricType.PING_LOSS, ping_result.packet_loss
-        )
-        if alert:
-            results["alerts"].append(alert.id)
-
-        # Resolve any existing device_unreachable alerts since ping succeeded
-        stmt = select(Alert).where(
-            Alert.device_id == device.id,
-            Alert.alert_type == "device_unreachable",
-            Alert.status.in_([AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]),
-        )
-        result = await db.execute(stmt)
-        unreachable_alerts = result.scalars().all()
-        for unreachable_alert in unreachable_alerts:
-            unreachable_alert.status = AlertStatus.RESOLVED
-            unreachable_alert.resolved_at = datetime.utcnow()
-            unreachable_alert.resolution_notes = f"Device {device.name} is now responding to ping (auto-resolved)"
-            logger.info(f"Alert auto-resolved: Device {device.name} is now reachable")
-    else:
-        results["errors"].append(f"Ping failed: {ping_result.error}")
-        # Create unreachable alert
-        stmt = select(Alert).where(
-            Alert.device_id == device.id,
-            Alert.alert_type == "device_unreachable",
-            Alert.status == AlertStatus.ACTIVE,
-        )
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if not existing:
-            alert = Alert(
-                device_id=device.id,
-                title="Device Unreachable",
-                message=f"Device {device.name} ({device.ip_address}) is not responding to ping",
-                severity=AlertSeverity.CRITICAL,
-                status=AlertStatus.ACTIVE,
-                alert_type="device_unreachable",
-            )
-            db.add(alert)
-            await db.flush()
-            results["alerts"].append(alert.id)
+            # Update device status and return early - skip SNMP if ping fails
+            device.is_reachable = False
+            return results
 
-        # Update device status and return early - skip SNMP if ping fails
-        device.is_reachable = False
-        return results
+        # Commit the ping phase before the SNMP round trips, so no
+        # transaction (or alert row lock) is held open across the device I/O
+        await commit_phase(db, metrics_buffer, state)
 
-    # SNMP polling - only if ping succeeded
-    snmp_community = device.snmp_community or settings.snmp_community
+    # SNMP polling - only if ping succeeded. The reads are kept on the poll
+    # state, so a re-run after a dropped database connection reuses them.
+    snmp_data = state.snmp_data
     try:
-        params = ConnectionParams(
-            host=device.ip_address,
-            snmp_community=snmp_community,
-            timeout=settings.snmp_timeout_seconds,
-        )
-        snmp_driver = SNMPDriver(params)
-        connect_result = snmp_driver.connect()
-
-        if not connect_result.success:
-            logger.warning(f"Device {device.name} ({device.ip_address}): SNMP connect failed: {connect_result.error}")
-
-        if connect_result.success:
-            # Get CPU utilization
-            cpu_result = snmp_driver.get_cpu_utilization()
-            if cpu_result.success and cpu_result.data is not None:
-                # Extract 5-minute CPU average from the dict
-                cpu_data = cpu_result.data
-                raw_cpu = cpu_data.get("cpu_5min", cpu_data.get("cpu_1min", 0))
-                # Handle "No Such Instance" errors from unsupported OIDs
-                # Values can be numeric or string representation of numbers
-                if raw_cpu is not None:
-                    # Skip SNMP error strings like "No Such Instance..."
-                    if isinstance(raw_cpu, str) and "No Such" in raw_cpu:
-                        pass
-                    else:
-                        try:
-                            cpu_value = float(raw_cpu)
-                            results["metrics"].append(
-                                {"type": MetricType.CPU_UTILIZATION.value, "value": cpu_value}
-                            )
-                            await store_metric(
-                                db,
-                                device.id,
-                                MetricType.CPU_UTILIZATION,
-                                cpu_value,
-                                "cpu_utilization",
-                                unit="%",
-                            )
-                            alert = await check_and_create_alert(
-                                db, device.id, MetricType.CPU_UTILIZATION, cpu_value
-                            )
-                            if alert:
-                                results["alerts"].append(alert.id)
-                        except (ValueError, TypeError):
-                            pass  # Skip if value can't be converted
-
-            # Get memory utilization
-            memory_result = snmp_driver.get_memory_utilization()
-            if memory_result.success and memory_result.data is not None:
-                # Extract memory utilization percentage from the dict
-                memory_data = memory_result.data
-                raw_memory = memory_data.get("memory_utilization", 0)
-                # Handle "No Such Instance" errors from unsupported OIDs
-                # Values can be numeric or string representation of numbers
-                if raw_memory is not None:
-                    # Skip SNMP error strings like "No Such Instance..."
-                    if isinstance(raw_memory, str) and "No Such" in raw_memory:
-                        pass
-                    else:
-                        try:
-                            memory_value = float(raw_memory)
-                            results["metrics"].append(
-                                {"type": MetricType.MEMORY_UTILIZATION.value, "value": memory_value}
-                            )
-                            await store_metric(
-                                db,
-                                device.id,
-                                MetricType.MEMORY_UTILIZATION,
-                                memory_value,
-                                "memory_utilization",
-                                unit="%",
-                            )
-                            alert = await check_and_create_alert(
-                                db, device.id, MetricType.MEMORY_UTILIZATION, memory_value
-                            )
-                            if alert:
-                                results["alerts"].append(alert.id)
-                        except (ValueError, TypeError):
-                            pass  # Skip if value can't be converted
+        if snmp_data is None:
+            params = ConnectionParams(
+                host=device.ip_address,
+                snmp_community=device.snmp_community or settings.snmp_community,
+                timeout=settings.snmp_timeout_seconds,
+            )
+            snmp_driver = SNMPDriver(params)
+            connect_result = await asyncio.to_thread(snmp_driver.connect)
+
+            if connect_result.success:
+                # All SNMP reads in one trip off the event loop
+                snmp_data = state.snmp_data = await asyncio.to_thread(
+                    collect_snmp_data, snmp_driver
+                )
+                snmp_driver.disconnect()
+            else:
+                logger.warning(
+                    f"Device {device.name} ({device.ip_address}): "
+                    f"SNMP connect failed: {connect_result.error}"
+                )
+                results["errors"].append(f"SNMP connection failed: {connect_result.error}")
+
+        if snmp_data is not None:
+            # CPU and memory utilization
+            if state.committed_phases < POLL_PHASE_SCALAR:
+                for metric_type, attr, keys in SCALAR_METRICS:
+                    scalar_result = getattr(snmp_data, attr)
+                    if not scalar_result.success or scalar_result.data is None:
+                        continue
+                    value = scalar_value(scalar_result.data, keys)
+                    if value is None:
+                        continue
+                    results["metrics"].append({"type": metric_type.value, "value": value})
+                    buffer_metric(
+                        metrics_buffer,
+                        device.id,
+                        metric_type,
+                        value,
+                        metric_type.value,
+                        unit="%",
+                        created_at=now,
+                    )
+                    alert = await check_and_create_alert(
+                        db,
+                        device.id,
+                        metric_type,
+                        value,
+                        existing_alert=first_alert(open_alerts, metric_type.value),
+                        now=now,
+                    )
+                    if alert:
+                        results["alerts"].append(alert.id)
+
+                await commit_phase(db, metrics_buffer, state)
 
             # Get interface names first (ifDescr) to map if_index to real names
             interface_names = {}
-            names_result = snmp_driver.get_interface_names()
+            names_result = snmp_data.names
             if names_result.success and names_result.data:
                 interface_names = names_result.data
                 logger.info(f"Device {device.name}: Found {len(interface_names)} interfaces")
@@ -491,7 +765,7 @@ async def poll_device_metrics(db: AsyncSession, device: Device) -> dict:
 
             # Get interface statuses
             # get_interface_status returns {if_index: status_string} like {"1": "up", "2": "down"}
-            interfaces = snmp_driver.get_interface_status()
+            interfaces = snmp_data.status
             if interfaces.success and interfaces.data:
                 logger.info(f"Device {device.name}: Got status for {len(interfaces.data)} interfaces")
             else:
@@ -499,199 +773,286 @@ async def poll_device_metrics(db: AsyncSession, device: Device) -> dict:
 
             # Get admin status to filter out administratively shutdown interfaces
             admin_statuses = {}
-            admin_result = snmp_driver.get_interface_admin_status()
+            admin_result = snmp_data.admin_status
             if admin_result.success and admin_result.data:
                 admin_statuses = admin_result.data
 
             if interfaces.success and interfaces.data:
+                # Previous octet counters for every interface, fetched in one query
+                previous_counters = await get_previous_metrics_bulk(
+                    db,
+                    device.id,
+                    [MetricType.INTERFACE_IN_OCTETS, MetricType.INTERFACE_OUT_OCTETS],
+                    now=now,
+                )
+
+                # Existing interface-down alerts (active or acknowledged) by if_index
+                interface_alerts = {
+                    alert.context["if_index"]: alert
+                    for alert in open_alerts.get("interface_down", [])
+                    if alert.context and "if_index" in alert.context
+                }
+
+                # Traffic counters for every interface (one GETBULK walk)
+                interface_counters = {}
+                counters_result = snmp_data.counters
+                if counters_result.success and counters_result.data:
+                    interface_counters = counters_result.data
+                else:
+                    logger.debug(
+                        f"Device {device.name}: Could not walk interface counters: "
+                        f"{counters_result.error}"
+                    )
+
+                # Bound once rather than looked up per interface; port-dense
+                # switches run this loop hundreds of times per poll
+                device_id = device.id
+                sampled_at = snmp_data.counters_at
+                mt_status = MetricType.INTERFACE_STATUS
+                mt_in_octets = MetricType.INTERFACE_IN_OCTETS
+                mt_out_octets = MetricType.INTERFACE_OUT_OCTETS
+                mt_in_rate = MetricType.INTERFACE_IN_RATE
+                mt_out_rate = MetricType.INTERFACE_OUT_RATE
+                mt_in_errors = MetricType.INTERFACE_IN_ERRORS
+                mt_out_errors = MetricType.INTERFACE_OUT_ERRORS
+
                 for if_index, status in interfaces.data.items():
                     if_name = interface_names.get(if_index, f"Interface {if_index}")
+                    context_str = f"if_index_{if_index}"
                     admin_status = admin_statuses.get(if_index, "up")
 
                     # Store interface status (1=up, 0=down)
                     status_value = 1.0 if status == "up" else 0.0
-                    await store_metric(
-                        db,
-                        device.id,
-                        MetricType.INTERFACE_STATUS,
+                    buffer_metric(
+                        metrics_buffer,
+                        device_id,
+                        mt_status,
                         status_value,
                         f"interface_{if_index}_status",
-                        context=f"if_index_{if_index}",
+                        context=context_str,
                         metadata={"if_index": if_index, "status": status, "if_name": if_name, "admin_status": admin_status},
+                        created_at=sampled_at,
                     )
 
-                    # Check for interface down alerts (skip admin-shutdown interfaces)
-                    alert = await check_interface_down_alert(
-                        db, device.id, if_index, if_name, status, device.name, admin_status
-                    )
-                    if alert:
-                        results["alerts"].append(alert.id)
-
-                    # Get traffic counters for each interface
+                    # Check for interface down alerts (skip admin-shutdown interfaces).
+                    # An interface that isn't down and has no open alert has
+                    # nothing to create or resolve, which is the common case.
+                    existing_alert = interface_alerts.get(if_index)
+                    if status == "down" or existing_alert is not None:
+                        alert = await check_interface_down_alert(
+                            db,
+                            device_id,
+                            if_index,
+                            if_name,
+                            status,
+                            device.name,
+                            admin_status,
+                            existing_alert=existing_alert,
+                            now=now,
+                        )
+                        if alert:
+                            results["alerts"].append(alert.id)
+
+                    # Process traffic counters for each interface
                     try:
-                        counters = snmp_driver.get_interface_counters(int(if_index))
-                        if counters.success and counters.data:
+                        counters = interface_counters.get(if_index)
+                        if counters:
                             # Store in/out octets (values may be strings from SNMP)
-                            in_octets_raw = counters.data.get("in_octets", 0)
-                            out_octets_raw = counters.data.get("out_octets", 0)
-                            in_errors_raw = counters.data.get("in_errors", 0)
-                            out_errors_raw = counters.data.get("out_errors", 0)
-                            current_time = datetime.utcnow()
-                            context_str = f"if_index_{if_index}"
+                            in_octets = to_float(counters.get("in_octets", 0))
+                            out_octets = to_float(counters.get("out_octets", 0))
+                            in_errors = to_float(counters.get("in_errors", 0))
+                            out_errors = to_float(counters.get("out_errors", 0))
 
                             # Process IN octets and calculate rate
-                            try:
-                                in_octets = float(in_octets_raw)
-
+                            if in_octets is not None:
+                                in_octets_name = IN_OCTETS_NAME.format(if_index)
                                 # Get previous in_octets for rate calculation
-                                prev_in = await get_previous_metric(
-                                    db, device.id, MetricType.INTERFACE_IN_OCTETS, context_str
-                                )
+                                prev_in = previous_counters.get((mt_in_octets, context_str))
 
                                 # Store current counter
-                                await store_metric(
-                                    db,
-                                    device.id,
-                                    MetricType.INTERFACE_IN_OCTETS,
+                                buffer_metric(
+                                    metrics_buffer,
+                                    device_id,
+                                    mt_in_octets,
                                     in_octets,
-                                    f"interface_{if_index}_in_octets",
+                                    in_octets_name,
                                     unit="bytes",
                                     context=context_str,
                                     metadata={"if_name": if_name},
+                                    created_at=sampled_at,
                                 )
 
                                 # Calculate and store rate if we have previous data
-                                if prev_in:
+                                # (only against a sample of the same counter width)
+                                if prev_in and prev_in.metric_name == in_octets_name:
                                     in_rate = calculate_rate_bps(
-                                        in_octets, prev_in.value, current_time, prev_in.created_at
+                                        in_octets,
+                                        prev_in.value,
+                                        sampled_at,
+                                        prev_in.created_at,
+                                        counter_bits=INTERFACE_COUNTER_BITS,
                                     )
                                     if in_rate is not None and in_rate >= 0:
-                                        await store_metric(
-                                            db,
-                                            device.id,
-                                            MetricType.INTERFACE_IN_RATE,
+                                        buffer_metric(
+                                            metrics_buffer,
+                                            device_id,
+                                            mt_in_rate,
                                             in_rate,
                                             f"interface_{if_index}_in_rate",
                                             unit="bps",
                                             context=context_str,
                                             metadata={"if_name": if_name},
+                                            created_at=sampled_at,
                                         )
-                            except (ValueError, TypeError):
-                                pass
 
                             # Process OUT octets and calculate rate
-                            try:
-                                out_octets = float(out_octets_raw)
-
+                            if out_octets is not None:
+                                out_octets_name = OUT_OCTETS_NAME.format(if_index)
                                 # Get previous out_octets for rate calculation
-                                prev_out = await get_previous_metric(
-                                    db, device.id, MetricType.INTERFACE_OUT_OCTETS, context_str
-                                )
+                                prev_out = previous_counters.get((mt_out_octets, context_str))
 
                                 # Store current counter
-                                await store_metric(
-                                    db,
-                                    device.id,
-                                    MetricType.INTERFACE_OUT_OCTETS,
+                                buffer_metric(
+                                    metrics_buffer,
+                                    device_id,
+                                    mt_out_octets,
                                     out_octets,
-                                    f"interface_{if_index}_out_octets",
+                                    out_octets_name,
                                     unit="bytes",
                                     context=context_str,
                                     metadata={"if_name": if_name},
+                                    created_at=sampled_at,
                                 )
 
                                 # Calculate and store rate if we have previous data
-                                if prev_out:
+                                # (only against a sample of the same counter width)
+                                if prev_out and prev_out.metric_name == out_octets_name:
                                     out_rate = calculate_rate_bps(
-                                        out_octets, prev_out.value, current_time, prev_out.created_at
+                                        out_octets,
+                                        prev_out.value,
+                                        sampled_at,
+                                        prev_out.created_at,
+                                        counter_bits=INTERFACE_COUNTER_BITS,
                                     )
                                     if out_rate is not None and out_rate >= 0:
-                                        await store_metric(
-                                            db,
-                                            device.id,
-                                            MetricType.INTERFACE_OUT_RATE,
+                                        buffer_metric(
+                                            metrics_buffer,
+                                            device_id,
+                                            mt_out_rate,
                                             out_rate,
                                             f"interface_{if_index}_out_rate",
                                             unit="bps",
                                             context=context_str,
                                             metadata={"if_name": if_name},
+                                            created_at=sampled_at,
                                         )
-                            except (ValueError, TypeError):
-                                pass
-
-                            try:
-                                in_errors = float(in_errors_raw)
-                                if in_errors > 0:
-                                    await store_metric(
-                                        db,
-                                        device.id,
-                                        MetricType.INTERFACE_IN_ERRORS,
-                                        in_errors,
-                                        f"interface_{if_index}_in_errors",
-                                        context=context_str,
-                                        metadata={"if_name": if_name},
-                                    )
-                            except (ValueError, TypeError):
-                                pass
-
-                            try:
-                                out_errors = float(out_errors_raw)
-                                if out_errors > 0:
-                                    await store_metric(
-                                        db,
-                                        device.id,
-                                        MetricType.INTERFACE_OUT_ERRORS,
-                                        out_errors,
-                                        f"interface_{if_index}_out_errors",
-                                        context=context_str,
-                                        metadata={"if_name": if_name},
-                                    )
-                            except (ValueError, TypeError):
-                                pass
+
+                            if in_errors is not None and in_errors > 0:
+                                buffer_metric(
+                                    metrics_buffer,
+                                    device_id,
+                                    mt_in_errors,
+                                    in_errors,
+                                    f"interface_{if_index}_in_errors",
+                                    context=context_str,
+                                    metadata={"if_name": if_name},
+                                    created_at=sampled_at,
+                                )
+
+                            if out_errors is not None and out_errors > 0:
+                                buffer_metric(
+                                    metrics_buffer,
+                                    device_id,
+                                    mt_out_errors,
+                                    out_errors,
+                                    f"interface_{if_index}_out_errors",
+                                    context=context_str,
+                                    metadata={"if_name": if_name},
+                                    created_at=sampled_at,
+                                )
                     except Exception as e:
                         logger.debug(f"Could not get counters for interface {if_index}: {e}")
 
-            snmp_driver.disconnect()
             results["success"] = True
-        else:
-            results["errors"].append(f"SNMP connection failed: {connect_result.error}")
 
+    except DBAPIError:
+        raise
     except Exception as e:
         logger.error(f"SNMP polling error for {device.name}: {e}")
         results["errors"].append(f"SNMP error: {str(e)}")
 
+    # Write the interface phase's metrics; the caller commits
+    await copy_metrics(db, metrics_buffer)
+
     # Update device status
     device.is_reachable = results["success"] or ping_result.success
     if device.is_reachable:
-        device.last_seen = datetime.utcnow().isoformat()
+        device.last_seen = now
 
     return results
 
 
-# Maximum concurrent device polls to avoid overwhelming the network/database
-# Increased to 10 for faster overall polling with 22 devices
-MAX_CONCURRENT_POLLS = 10
+def attach_device(db: AsyncSession, device: Device) -> Device:
+    """Add a Device built from known column values to the session as persistent.
 
+    No SELECT is issued; columns that weren't given are left unloaded, and
+    only the attributes the caller then changes are written on flush.
+    """
+    make_transient_to_detached(device)
+    db.add(device)
+    return device
+
+
+async def poll_device_with_session(
+    device: Row,
+    session_factory,
+    retry_on_disconnect: bool = True,
+    ping_result: Optional[PingResult] = None,
+    state: Optional[DevicePollState] = None,
+) -> dict:
+    """Poll a single device with its own database session for concurrent execution.
+
+    ``device`` is a POLL_DEVICE_COLUMNS row; it's attached to the session
+    without re-selecting it, so the poll's status changes are tracked.
+
+    The polling engine doesn't pre-ping pooled connections, so if the
+    session's connection turns out to be dead the poll is run once more on
+    a fresh one. The retry carries the poll's DevicePollState: it resumes
+    at the phase that failed, without pinging or reading SNMP again.
+
+    What a retry may run twice:
+
+    - Device I/O (ping, SNMP): never; the first attempt's reads are reused.
+    - A committed phase: never; its metrics and alerts are already stored.
+    - The failed phase's database work: yes. Its transaction was rolled
+      back, and the alert checks re-read open alerts on the new session,
+      so nothing is duplicated.
+    - A phase whose COMMIT itself failed: no. The commit may have landed
+      before the connection dropped, so the poll is reported as failed
+      rather than risk writing its metrics twice.
+    """
+    if state is None:
+        state = DevicePollState.for_device(device)
 
-async def poll_device_with_session(device: Device, session_factory) -> dict:
-    """Poll a single device with its own database session for concurrent execution."""
     async with session_factory() as db:
         try:
-            # Fetch device fresh in this session so changes are tracked
-            result = await db.execute(
-                select(Device).where(Device.id == device.id)
-            )
-            fresh_device = result.scalar_one_or_none()
-            if not fresh_device:
+            db_device = attach_device(db, Device(**device._mapping))
+            result = await poll_device_metrics(db, db_device, ping_result, state)
+            await state.commit(db)
+            return result
+        except DBAPIError as e:
+            await db.rollback()
+            if not (
+                retry_on_disconnect and e.connection_invalidated and not state.commit_in_doubt
+            ):
+                logger.error(f"Error polling device {device.name}: {e}")
                 return {
                     "device_id": device.id,
                     "device_name": device.name,
                     "success": False,
-                    "error": "Device not found",
+                    "error": str(e),
                 }
-            result = await poll_device_metrics(db, fresh_device)
-            await db.commit()
-            return result
+            logger.warning(f"Stale database connection polling {device.name}, retrying")
         except Exception as e:
             logger.error(f"Error polling device {device.name}: {e}")
             await db.rollback()
@@ -702,89 +1063,340 @@ async def poll_device_with_session(device: Device, session_factory) -> dict:
                 "error": str(e),
             }
 
+    return await poll_device_with_session(
+        device, session_factory, retry_on_disconnect=False, ping_result=ping_result, state=state
+    )
+
+
+# Columns a device poll needs, streamed instead of full Device rows
+POLL_DEVICE_COLUMNS = (
+    Device.id,
+    Device.name,
+    Device.ip_address,
+    Device.snmp_community,
+    Device.device_type,
+)
+
+# Devices fetched per round trip while streaming the poll list
+DEVICE_STREAM_BATCH_SIZE = 500
+
+
+async def ping_devices(db: AsyncSession, *criteria) -> dict[str, PingResult]:
+    """Ping every device matching ``criteria`` with one fping run, by IP."""
+    result = await db.execute(select(Device.ip_address).where(*criteria))
+    return await ping_hosts(result.scalars().all(), count=3, timeout=3)
+
+
+async def poll_devices(
+    devices: AsyncIterable[Row],
+    session_factory,
+    ping_results: Optional[Mapping[str, PingResult]] = None,
+) -> dict[int, dict]:
+    """Poll devices concurrently, returning each device's result by id.
+
+    A fixed pool of MAX_CONCURRENT_POLLS workers drains a bounded queue that
+    is fed as ``devices`` streams in, so neither the number of live
+    coroutines nor the devices held in memory grow with the fleet size.
+
+    ``ping_results`` (from ping_devices) saves each worker its own ping
+    subprocess for devices that answered the fleet-wide ping.
+    """
+    ping_results = ping_results or {}
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_CONCURRENT_POLLS * 2)
+
+    # Results keyed by device id, filled in as workers finish
+    results_by_device: dict[int, dict] = {}
+
+    async def worker():
+        while True:
+            device = await queue.get()
+            try:
+                result = await poll_device_with_session(
+                    device, session_factory, ping_result=ping_results.get(device.ip_address)
+                )
+            except asyncio.CancelledError:
+                queue.task_done()
+                raise
+            except Exception as e:
+                logger.error(f"Exception polling device {device.name}: {e}")
+                result = {
+                    "device_id": device.id,
+                    "device_name": device.name,
+                    "success": False,
+                    "error": str(e),
+                }
+            else:
+                # Per-device detail is debug-grade; don't build the message
+                # for every device unless it will be emitted
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Polled device {result['device_name']}: success={result['success']}, "
+                        f"metrics={len(result.get('metrics', []))}, "
+                        f"alerts={len(result.get('alerts', []))}"
+                    )
+            results_by_device[device.id] = result
+            queue.task_done()
+
+    # The TaskGroup cancels the workers if feeding the queue fails
+    async with asyncio.TaskGroup() as tg:
+        workers = [tg.create_task(worker()) for _ in range(MAX_CONCURRENT_POLLS)]
+        async for device in devices:
+            await queue.put(device)
+        await queue.join()
+        for task in workers:
+            task.cancel()
+
+    return results_by_device
+
+
+def summarize_poll_results(results) -> dict:
+    """Count successes, failures and alerts across device poll results."""
+    successful = failed = total_alerts = 0
+    for result in results:
+        if result.get("success"):
+            successful += 1
+        else:
+            failed += 1
+        total_alerts += len(result.get("alerts", ()))
+    return {"successful": successful, "failed": failed, "total_alerts": total_alerts}
+
 
 @celery_app.task(bind=True)
 def poll_all_devices(self):
-    """Poll all active devices for metrics using parallel execution."""
+    """Poll all active pull-mode devices for metrics using parallel execution.
+
+    Event-mode devices are polled by handle_device_event when they report
+    something, with poll_event_devices as a slower safety net.
+
+    With ``polling_shards`` > 1 the devices are split across that many
+    poll_device_group subtasks, so the polling runs on several worker
+    processes; aggregate_poll_results logs the combined outcome.
+    """
     logger.info(f"Starting poll_all_devices task: {self.request.id}")
 
     async def _poll_all():
-        AsyncSessionLocal = get_async_session()
+        session_factory = get_polling_session()
 
-        # Get device list in a separate session
-        async with AsyncSessionLocal() as db:
-            result = await db.execute(
-                select(Device).where(Device.is_active == True)
+        shard_count = settings.polling_shards
+        if shard_count > 1:
+            async with session_factory() as db:
+                result = await db.execute(
+                    select(Device.id).where(
+                        Device.is_active.is_(True), Device.polling_mode == PollingMode.PULL
+                    )
+                )
+                device_ids = result.scalars().all()
+
+            if not device_ids:
+                logger.info("No active devices to poll")
+                return {"status": "success", "devices_polled": 0, "results": []}
+
+            shard_count = min(shard_count, len(device_ids))
+            shards = [device_ids[i::shard_count] for i in range(shard_count)]
+            logger.info(f"Polling {len(device_ids)} active devices across {shard_count} subtasks")
+            chord(poll_device_group.s(ids) for ids in shards)(
+                aggregate_poll_results.s(self.request.id)
             )
-            devices = result.scalars().all()
+            return {
+                "status": "dispatched",
+                "task_id": self.request.id,
+                "devices_polled": len(device_ids),
+                "shards": shard_count,
+            }
 
-        if not devices:
+        logger.info(
+            f"Polling active devices: poll_concurrency={MAX_CONCURRENT_POLLS}, "
+            f"pool_size={POOL_SIZE}"
+        )
+
+        # Stream the device list (in its own session) into the worker queue
+        # while the workers are already polling
+        pull_devices = (Device.is_active.is_(True), Device.polling_mode == PollingMode.PULL)
+        async with session_factory() as db:
+            ping_results = await ping_devices(db, *pull_devices)
+            devices = await db.stream(
+                select(*POLL_DEVICE_COLUMNS)
+                .where(*pull_devices)
+                .execution_options(yield_per=DEVICE_STREAM_BATCH_SIZE)
+            )
+            results_by_device = await poll_devices(devices, session_factory, ping_results)
+
+        if not results_by_device:
             logger.info("No active devices to poll")
             return {"status": "success", "devices_polled": 0, "results": []}
 
-        logger.info(f"Polling {len(devices)} active devices with max {MAX_CONCURRENT_POLLS} concurrent")
+        return {
+            "status": "success",
+            "task_id": self.request.id,
+            "devices_polled": len(results_by_device),
+            **summarize_poll_results(results_by_device.values()),
+        }
 
-        # Use semaphore to limit concurrent polls
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+    return run_async(_poll_all())
 
-        async def poll_with_semaphore(device):
-            async with semaphore:
-                return await poll_device_with_session(device, AsyncSessionLocal)
 
-        # Poll all devices concurrently (limited by semaphore)
-        results = await asyncio.gather(
-            *[poll_with_semaphore(device) for device in devices],
-            return_exceptions=True
-        )
+@celery_app.task(bind=True)
+def poll_device_group(self, device_ids: list[int]):
+    """Poll one shard of devices dispatched by poll_all_devices."""
+    logger.info(f"Starting poll_device_group task for {len(device_ids)} devices")
+
+    async def _poll_group():
+        session_factory = get_polling_session()
+        group_devices = (Device.id.in_(device_ids), Device.is_active.is_(True))
+        async with session_factory() as db:
+            ping_results = await ping_devices(db, *group_devices)
+            devices = await db.stream(
+                select(*POLL_DEVICE_COLUMNS)
+                .where(*group_devices)
+                .execution_options(yield_per=DEVICE_STREAM_BATCH_SIZE)
+            )
+            results_by_device = await poll_devices(devices, session_factory, ping_results)
 
-        # Process results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Exception polling device {devices[i].name}: {result}")
-                processed_results.append({
-                    "device_id": devices[i].id,
-                    "device_name": devices[i].name,
-                    "success": False,
-                    "error": str(result),
-                })
-            else:
-                processed_results.append(result)
-                logger.info(
-                    f"Polled device {result['device_name']}: success={result['success']}, "
-                    f"metrics={len(result.get('metrics', []))}, alerts={len(result.get('alerts', []))}"
-                )
+        return {
+            "devices_polled": len(results_by_device),
+            **summarize_poll_results(results_by_device.values()),
+        }
+
+    return run_async(_poll_group())
+
+
+@celery_app.task(bind=True)
+def poll_event_devices(self):
+    """Safety-net poll of event-mode devices.
+
+    Runs every ``event_device_poll_interval_seconds`` so an event-mode
+    device whose traps/syslog stop arriving still gets polled.
+    """
+    logger.info(f"Starting poll_event_devices task: {self.request.id}")
+
+    async def _poll_event_devices():
+        session_factory = get_polling_session()
+        event_devices = (Device.is_active.is_(True), Device.polling_mode == PollingMode.EVENT)
+        async with session_factory() as db:
+            ping_results = await ping_devices(db, *event_devices)
+            devices = await db.stream(
+                select(*POLL_DEVICE_COLUMNS)
+                .where(*event_devices)
+                .execution_options(yield_per=DEVICE_STREAM_BATCH_SIZE)
+            )
+            results_by_device = await poll_devices(devices, session_factory, ping_results)
 
         return {
             "status": "success",
             "task_id": self.request.id,
-            "devices_polled": len(devices),
-            "successful": sum(1 for r in processed_results if r.get("success")),
-            "failed": sum(1 for r in processed_results if not r.get("success")),
-            "total_alerts": sum(len(r.get("alerts", [])) for r in processed_results),
+            "devices_polled": len(results_by_device),
+            **summarize_poll_results(results_by_device.values()),
         }
 
-    return run_async(_poll_all())
+    return run_async(_poll_event_devices())
+
+
+# Only looks up the device and queues a poll, so redelivery is harmless
+@celery_app.task(bind=True, acks_late=True)
+def handle_device_event(self, ip_address: str, event: Optional[str] = None):
+    """Poll a device in response to an event it sent (SNMP trap, syslog).
+
+    Enqueued by POST /api/devices/events, which trap/syslog receivers call
+    with the source address; the poll itself runs as a poll_device task
+    carrying the device payload.
+    """
+    logger.info(f"Device event from {ip_address}: {event}")
+
+    async def _handle():
+        session_factory = get_async_session()
+        async with session_factory() as db:
+            # Two rows are enough to tell whether the address is ambiguous
+            result = await db.execute(
+                select(Device)
+                .where(Device.ip_address == ip_address, Device.is_active.is_(True))
+                .order_by(Device.id)
+                .limit(2)
+            )
+            devices = result.scalars().all()
+
+        if not devices:
+            return {"status": "skipped", "reason": f"No active device with IP {ip_address}"}
+
+        device = devices[0]
+        if len(devices) > 1:
+            logger.warning(
+                f"Device event from {ip_address} matches more than one active device; "
+                f"polling the oldest, {device.name} (id {device.id})"
+            )
+
+        task = poll_device.delay(device.id, device_payload(device))
+        return {"status": "queued", "device_id": device.id, "poll_task_id": task.id}
+
+    return run_async(_handle())
 
 
 @celery_app.task(bind=True)
-def poll_device(self, device_id: int):
-    """Poll a specific device for metrics."""
+def aggregate_poll_results(self, shard_results: list[dict], parent_task_id: str):
+    """Combine the poll_device_group results of one poll_all_devices run."""
+    summary = {
+        "status": "success",
+        "task_id": parent_task_id,
+        "devices_polled": sum(r["devices_polled"] for r in shard_results),
+        "successful": sum(r["successful"] for r in shard_results),
+        "failed": sum(r["failed"] for r in shard_results),
+        "total_alerts": sum(r["total_alerts"] for r in shard_results),
+    }
+    logger.info(
+        f"poll_all_devices {parent_task_id}: polled {summary['devices_polled']} devices, "
+        f"{summary['successful']} successful, {summary['failed']} failed"
+    )
+    return summary
+
+
+def device_payload(device: Device) -> dict:
+    """Device fields to send in a poll_device/check_device_connectivity message.
+
+    Passing these as the task's ``device`` argument lets the task skip
+    re-selecting the device row.
+    """
+    return {
+        "name": device.name,
+        "ip_address": device.ip_address,
+        "snmp_community": device.snmp_community,
+        "device_type": device.device_type.value,
+    }
+
+
+def device_from_payload(device_id: int, payload: dict) -> Device:
+    """Build a transient Device from a device_payload() dict."""
+    return Device(
+        id=device_id,
+        name=payload["name"],
+        ip_address=payload["ip_address"],
+        snmp_community=payload.get("snmp_community"),
+        device_type=DEVICE_TYPE_BY_VALUE[payload["device_type"]],
+    )
+
+
+# Idempotent per-device task: ack late so one lost with its worker is redelivered
+@celery_app.task(bind=True, time_limit=60, acks_late=True)
+def poll_device(self, device_id: int, device: Optional[dict] = None):
+    """Poll a specific device for metrics.
+
+    ``device`` is an optional device_payload(); when given, the device row
+    isn't selected and only the status columns the poll changes are written.
+    """
     logger.info(f"Starting poll_device task for device {device_id}")
 
     async def _poll_device():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
-                result = await db.execute(
-                    select(Device).where(Device.id == device_id)
-                )
-                device = result.scalar_one_or_none()
+                if device is not None:
+                    db_device = attach_device(db, device_from_payload(device_id, device))
+                else:
+                    result = await db.execute(DEVICE_BY_ID, {"device_id": device_id})
+                    db_device = result.scalar_one_or_none()
 
-                if not device:
+                if not db_device:
                     return {"status": "error", "error": f"Device {device_id} not found"}
 
-                poll_result = await poll_device_metrics(db, device)
+                poll_result = await poll_device_metrics(db, db_device)
                 await db.commit()
 
                 return {
@@ -801,14 +1413,27 @@ def poll_device(self, device_id: int):
     return run_async(_poll_device())
 
 
+# NetBox sync needs both a URL and an API token
+_NETBOX_ENABLED = bool(settings.netbox_url and settings.netbox_token)
+
+
 @celery_app.task(bind=True)
 def sync_netbox_devices(self):
     """Sync devices from NetBox."""
     logger.info(f"Starting sync_netbox_devices task: {self.request.id}")
 
+    # Settings-only check first, so an unconfigured install doesn't build a
+    # NetBox client or open a session every five minutes
+    if not _NETBOX_ENABLED:
+        logger.warning("NetBox not configured, skipping sync")
+        return {
+            "status": "skipped",
+            "reason": "NetBox not configured (missing token)",
+        }
+
     async def _sync():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 sync_service = NetBoxSyncService()
 
@@ -833,38 +1458,50 @@ def sync_netbox_devices(self):
     return run_async(_sync())
 
 
-@celery_app.task(bind=True)
-def check_device_connectivity(self, device_id: int):
-    """Check connectivity to a device (ping, SNMP, SSH)."""
+# Map device type to driver platform (read-only, built once at import)
+_PLATFORM_MAP: Mapping[DeviceType, DevicePlatform] = MappingProxyType({
+    DeviceType.ROUTER: DevicePlatform.CISCO_IOS,
+    DeviceType.SWITCH: DevicePlatform.CISCO_IOS,
+    DeviceType.FIREWALL: DevicePlatform.CISCO_ASA,
+})
+
+
+# Idempotent per-device task: ack late so one lost with its worker is redelivered
+@celery_app.task(bind=True, time_limit=60, acks_late=True)
+def check_device_connectivity(self, device_id: int, device: Optional[dict] = None):
+    """Check connectivity to a device (ping, SNMP, SSH).
+
+    ``device`` is an optional device_payload(); when given, the device row
+    isn't selected before the checks.
+    """
     from src.core.health_checks import check_device_connectivity as _check_connectivity
 
     logger.info(f"Starting connectivity check for device {device_id}")
 
     async def _check():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
-                result = await db.execute(
-                    select(Device).where(Device.id == device_id)
-                )
-                device = result.scalar_one_or_none()
+                if device is not None:
+                    target = device_from_payload(device_id, device)
+                else:
+                    result = await db.execute(
+                        DEVICE_CONNECTIVITY_BY_ID, {"device_id": device_id}
+                    )
+                    target = result.one_or_none()
+                    # Don't hold the read transaction open across the checks
+                    await db.commit()
 
-                if not device:
+                if not target:
                     return {"status": "error", "error": f"Device {device_id} not found"}
 
-                # Map device type to platform
-                platform_map = {
-                    DeviceType.ROUTER: DevicePlatform.CISCO_IOS,
-                    DeviceType.SWITCH: DevicePlatform.CISCO_IOS,
-                    DeviceType.FIREWALL: DevicePlatform.CISCO_ASA,
-                }
-                platform = platform_map.get(device.device_type, DevicePlatform.CISCO_IOS)
+                platform = _PLATFORM_MAP.get(target.device_type, DevicePlatform.CISCO_IOS)
 
                 check_result = await _check_connectivity(
-                    device_id=device.id,
-                    device_name=device.name,
-                    ip_address=device.ip_address,
-                    snmp_community=device.snmp_community or settings.snmp_community,
+                    device_id=device_id,
+                    device_name=target.name,
+                    ip_address=target.ip_address,
+                    snmp_community=target.snmp_community or settings.snmp_community,
                     platform=platform,
                     check_ping=True,
                     check_snmp=True,
@@ -872,15 +1509,18 @@ def check_device_connectivity(self, device_id: int):
                 )
 
                 # Update device status
-                device.is_reachable = check_result.overall_reachable
+                values = {"is_reachable": check_result.overall_reachable}
                 if check_result.overall_reachable:
-                    device.last_seen = datetime.utcnow().isoformat()
+                    values["last_seen"] = utc_now()
+                await db.execute(
+                    update(Device).where(Device.id == device_id).values(**values)
+                )
                 await db.commit()
 
                 return {
                     "status": "success",
                     "device_id": device_id,
-                    "device_name": device.name,
+                    "device_name": target.name,
                     "is_reachable": check_result.overall_reachable,
                     "ping": {
                         "success": check_result.ping.success if check_result.ping else False,
@@ -896,27 +1536,86 @@ def check_device_connectivity(self, device_id: int):
     return run_async(_check())
 
 
+async def metrics_is_hypertable(db: AsyncSession) -> bool:
+    """Check whether the metrics table is a TimescaleDB hypertable."""
+    result = await db.execute(
+        text("SELECT to_regclass('timescaledb_information.hypertables') IS NOT NULL")
+    )
+    if not result.scalar():
+        return False
+    result = await db.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM timescaledb_information.hypertables "
+            "WHERE hypertable_name = 'metrics')"
+        )
+    )
+    return bool(result.scalar())
+
+
+# Rows deleted per statement by cleanup_old_metrics
+CLEANUP_BATCH_SIZE = 10000
+
+
+async def delete_in_batches(db: AsyncSession, model, cutoff_date: datetime) -> int:
+    """Delete ``model`` rows created before ``cutoff_date``, CLEANUP_BATCH_SIZE at a time.
+
+    Each batch is committed, so no single transaction holds the whole
+    backlog's locks and WAL. Returns the number of rows deleted.
+    """
+    old_ids = (
+        select(model.id)
+        .where(model.created_at < cutoff_date)
+        .limit(CLEANUP_BATCH_SIZE)
+    )
+    deleted_count = 0
+    while True:
+        result = await db.execute(delete(model).where(model.id.in_(old_ids)))
+        await db.commit()
+        deleted_count += result.rowcount
+        if result.rowcount < CLEANUP_BATCH_SIZE:
+            return deleted_count
+        await asyncio.sleep(0)
+
+
 @celery_app.task(bind=True)
 def cleanup_old_metrics(self, days_to_keep: int = 30):
-    """Clean up old metric data to prevent database bloat."""
-    from datetime import timedelta
+    """Clean up old metric data to prevent database bloat.
 
+    On a TimescaleDB hypertable whole chunks are dropped; on plain PostgreSQL
+    old rows are deleted.
+    """
     logger.info(f"Starting cleanup_old_metrics task: keeping {days_to_keep} days")
 
     async def _cleanup():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
-                from sqlalchemy import delete
-
                 cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
 
-                # Delete old metrics
-                stmt = delete(Metric).where(Metric.created_at < cutoff_date)
-                result = await db.execute(stmt)
-                deleted_count = result.rowcount
+                if await metrics_is_hypertable(db):
+                    result = await db.execute(
+                        # older_than is declared "any", so the parameter's type
+                        # has to be spelled out for the server to accept it
+                        text(
+                            "SELECT count(*) FROM drop_chunks("
+                            "'metrics', older_than => CAST(:cutoff AS timestamp))"
+                        ),
+                        {"cutoff": cutoff_date},
+                    )
+                    dropped_chunks = result.scalar()
+                    await db.commit()
+                    # No FK cascade on a hypertable, so clear the sidecar rows too
+                    await delete_in_batches(db, MetricMetadata, cutoff_date)
 
-                await db.commit()
+                    logger.info(f"Dropped {dropped_chunks} metric chunks")
+                    return {
+                        "status": "success",
+                        "task_id": self.request.id,
+                        "dropped_chunks": dropped_chunks,
+                        "cutoff_date": cutoff_date.isoformat(),
+                    }
+
+                deleted_count = await delete_in_batches(db, Metric, cutoff_date)
 
                 logger.info(f"Deleted {deleted_count} old metrics")
                 return {
@@ -1,15 +1,14 @@
 """Remediation tasks for automated fixes."""
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
 
 import httpx
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.tasks import celery_app
+from src.tasks import celery_app, get_async_session, run_async
 from src.config import get_settings
 from src.models.device import Device, DeviceType
 from src.models.alert import Alert, AlertStatus
@@ -21,27 +20,6 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-def get_async_engine():
-    """Get async database engine for Celery tasks."""
-    return create_async_engine(settings.database_url, echo=settings.debug)
-
-
-def get_async_session():
-    """Get async session factory."""
-    engine = get_async_engine()
-    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-
-def run_async(coro):
-    """Run an async coroutine from sync Celery task."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
 def get_device_credentials(device: Device) -> dict:
     """Get device credentials from NetBox or return defaults from config."""
     credentials = {
@@ -122,8 +100,8 @@ def execute_remediation(self, device_id: int, playbook_name: str, alert_id: int
     logger.info(f"Starting remediation: playbook={playbook_name}, device={device_id}")
 
     async def _execute():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 # Get device
                 result = await db.execute(
@@ -281,8 +259,8 @@ def interface_enable(self, device_id: int, interface_name: str):
     logger.info(f"Enabling interface {interface_name} on device {device_id}")
 
     async def _enable():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 # Get device
                 result = await db.execute(
@@ -387,8 +365,8 @@ def clear_bgp_session(self, device_id: int, neighbor_ip: str):
     logger.info(f"Clearing BGP session to {neighbor_ip} on device {device_id}")
 
     async def _clear_bgp():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 result = await db.execute(
                     select(Device).where(Device.id == device_id)
@@ -472,8 +450,8 @@ def clear_device_caches(self, device_id: int):
     logger.info(f"Clearing caches on device {device_id}")
 
     async def _clear_caches():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 result = await db.execute(
                     select(Device).where(Device.id == device_id)
@@ -567,8 +545,8 @@ def send_webhook_alert(self, alert_id: int):
         return {"status": "skipped", "reason": "No webhook URL configured"}
 
     async def _send_webhook():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 result = await db.execute(
                     select(Alert).where(Alert.id == alert_id)
@@ -647,8 +625,8 @@ def auto_remediate_alert(self, alert_id: int):
     logger.info(f"Auto-remediating alert {alert_id}")
 
     async def _auto_remediate():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 result = await db.execute(
                     select(Alert).where(Alert.id == alert_id)
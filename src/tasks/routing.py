@@ -1,14 +1,13 @@
 """Routing protocol monitoring tasks using pyATS/Genie."""
 
-import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.tasks import celery_app
+from src.tasks import celery_app, get_async_session, run_async
 from src.config import get_settings
 from src.models.device import Device, DeviceType
 from src.models.metric import Metric, MetricType
@@ -20,27 +19,6 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-def get_async_engine():
-    """Get async database engine for Celery tasks."""
-    return create_async_engine(settings.database_url, echo=settings.debug)
-
-
-def get_async_session():
-    """Get async session factory."""
-    engine = get_async_engine()
-    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-
-def run_async(coro):
-    """Run an async coroutine from sync Celery task."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
 async def store_metric(
     db: AsyncSession,
     device_id: int,
@@ -51,7 +29,12 @@ async def store_metric(
     context: Optional[str] = None,
     metadata: Optional[dict] = None,
 ) -> Metric:
-    """Store a metric in the database."""
+    """Store a metric in the database.
+
+    The metric is only added to the session, not flushed: pending metrics are
+    written together at the next flush, which SQLAlchemy batches into
+    multi-row INSERT ... VALUES statements (insertmanyvalues).
+    """
     metric = Metric(
         device_id=device_id,
         metric_type=metric_type,
@@ -62,7 +45,6 @@ async def store_metric(
         metadata_=metadata,
     )
     db.add(metric)
-    await db.flush()
     return metric
 
 
@@ -316,13 +298,13 @@ def poll_routing_protocols(self):
     logger.info(f"Starting poll_routing_protocols task: {self.request.id}")
 
     async def _poll_all():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 # Get all active routers
                 result = await db.execute(
                     select(Device).where(
-                        Device.is_active == True,
+                        Device.is_active.is_(True),
                         Device.device_type == DeviceType.ROUTER,
                     )
                 )
@@ -397,8 +379,8 @@ def poll_device_routing_task(self, device_id: int):
     logger.info(f"Starting routing poll for device {device_id}")
 
     async def _poll_device():
-        AsyncSessionLocal = get_async_session()
-        async with AsyncSessionLocal() as db:
+        session_factory = get_async_session()
+        async with session_factory() as db:
             try:
                 result = await db.execute(
                     select(Device).where(Device.id == device_id)